@@ -10,6 +10,7 @@ import math
 import time
 import random
 from scaling import ScalingFormulas
+from constants import Emotion
 
 class BossAI:
     """Boss behavior and all attack patterns"""
@@ -164,8 +165,9 @@ class BossAI:
                 self.boss_state.y += (dy / dist) * speed * dt
         
         elif self.boss_state.charging:
-            self.boss_state.x += self.boss_state.charge_dir[0] * self.boss_state.charge_speed * dt
-            self.boss_state.y += self.boss_state.charge_dir[1] * self.boss_state.charge_speed * dt
+            step = self.boss_state.charge_speed * dt
+            self.boss_state.x += self.boss_state.charge_dir_x * step
+            self.boss_state.y += self.boss_state.charge_dir_y * step
             
             # Check bounds
             boss_r = 60
@@ -220,9 +222,10 @@ class BossAI:
             dir_y = py - self.boss_state.y
             length = math.hypot(dir_x, dir_y)
             if length > 0:
-                self.boss_state.charge_dir = [dir_x / length, dir_y / length]
+                self.boss_state.charge_dir_x = dir_x / length
+                self.boss_state.charge_dir_y = dir_y / length
                 self.boss_state.charge_speed = 600 + math.log(level + 1) * 180
-                self.boss_state.emotion = "charging"
+                self.boss_state.emotion = Emotion.CHARGING
                 self.animation_manager.spawn("charge_warning", self.boss_state.x, self.boss_state.y, lifetime=1.0)
             self.boss_state.last_charge = now
         
@@ -3,7 +3,7 @@ FILE: core/constants.py
 Game constants and enumerations
 """
 
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
 
 class GameMode(Enum):
     """Game mode types"""
@@ -24,6 +24,36 @@ class SessionState(Enum):
     IN_GAME = auto()
     RECONNECTING = auto()
 
+class Screen(IntEnum):
+    """Top-level screens the game loop dispatches on"""
+    MENU = 0
+    GAME = 1
+    SHOP = 2
+    LEVELSELECT = 3
+    SHOP_MENU = 4
+    ABILITY_TEMPLE = 5
+    SETTINGS = 6
+    ADMIN_MENU = 7
+    VICTORY = 8
+    GAMEOVER = 9
+    MULTIPLAYER_MENU = 10
+    MULTIPLAYER_LOBBY = 11
+    PVP_LOBBY = 12
+
+    def __str__(self):
+        return self.name
+
+class Emotion(IntEnum):
+    """Boss face expressions"""
+    NORMAL = 0
+    ANGRY = 1
+    CHARGING = 2
+    HURT = 3
+    SUPER = 4
+
+    def __str__(self):
+        return self.name.lower()
+
 # Screen dimensions
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
@@ -41,6 +71,7 @@ PROJECTILE_RADIUS = 8
 
 # Colors
 COLORS = {
+    "background": (8, 8, 35),
     "player": (0, 255, 0),
     "player_low_hp": (255, 255, 0),
     "player_critical": (255, 0, 0),
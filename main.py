@@ -33,7 +33,7 @@ from scaling import ScalingFormulas
 
 from config import (load_save, save_progress, reset_save, SCREEN_WIDTH, SCREEN_HEIGHT,
                     load_multiplayer_save, save_multiplayer_progress, update_multiplayer_stats)
-from constants import GameMode, SessionState
+from constants import COLORS, GameMode, SessionState, Screen, Emotion
 
 from client import NetworkClient, OfflineClient
 from server import GameServer
@@ -71,13 +71,14 @@ class Game:
         
         # Initialize state
         self.game_state = GameState()
-        self.game_state.level = 1
+        self.game_state.set_level(1)
         self.game_state.coins = self.save_data["coins"]
         self.game_state.max_level = self.save_data["max_level"]
         
         self.player_state = PlayerState()
         self.boss_state = BossState()
         self.admin_state = AdminState()
+        self.debug_flags = self.admin_state.flags
         
         # Initialize managers
         self.console = AdminConsole()
@@ -182,7 +183,7 @@ class Game:
         if message.data.get("victory"):
             self._handle_victory()
         else:
-            self.game_state.screen_state = "GAMEOVER"
+            self.game_state.screen_state = Screen.GAMEOVER
     
     def _on_chat(self, message):
         """Handle chat message from server"""
@@ -352,15 +353,15 @@ class Game:
                     self.console.visible = not self.console.visible
                 
                 # Pause toggle in game
-                if event.key == pygame.K_ESCAPE and self.game_state.screen_state == "GAME":
+                if event.key == pygame.K_ESCAPE and self.game_state.screen_state == Screen.GAME:
                     self.game_state.paused = not self.game_state.paused
                 
                 # Parry
-                if event.key == pygame.K_SPACE and self.game_state.screen_state == "GAME" and not self.game_state.paused:
+                if event.key == pygame.K_SPACE and self.game_state.screen_state == Screen.GAME and not self.game_state.paused:
                     self.player.activate_parry()
                 
                 # Secret code (when paused)
-                if self.game_state.paused and self.game_state.screen_state == "GAME":
+                if self.game_state.paused and self.game_state.screen_state == Screen.GAME:
                     key_map = {
                         pygame.K_w: 'w', pygame.K_a: 'a',
                         pygame.K_s: 's', pygame.K_d: 'd',
@@ -430,7 +431,7 @@ class Game:
         elif action_type == "enter_temple":
             self.ability_manager.roll_temple_choices(3)
             self.ability_manager.reset_temple_session()
-            self.game_state.screen_state = "ABILITY_TEMPLE"
+            self.game_state.screen_state = Screen.ABILITY_TEMPLE
         
         elif action_type == "select_ability":
             ability = action["ability"]
@@ -452,7 +453,7 @@ class Game:
         
         elif action_type == "leave_temple":
             self.ability_manager.reset_temple_session()
-            self.game_state.screen_state = "MENU"
+            self.game_state.screen_state = Screen.MENU
         
         elif action_type == "buy_upgrade":
             key = action["key"]
@@ -580,20 +581,21 @@ class Game:
     
     def start_level(self, level):
         """Start a specific level"""
-        self.game_state.level = level
-        self.game_state.screen_state = "GAME"
+        self.game_state.set_level(level)
+        self.game_state.screen_state = Screen.GAME
         self.game_state.paused = False
         
         # Reset boss
         self.boss_state.x = 400.0
         self.boss_state.y = 300.0
-        self.boss_state.max_hp = ScalingFormulas.boss_hp(level)
-        if level % 10 == 0:
-            self.boss_state.max_hp *= 2
+        boss_max_hp = ScalingFormulas.boss_hp(level)
+        if self.game_state.is_super_level:
+            boss_max_hp *= 2
+        self.boss_state.max_hp = boss_max_hp
         self.boss_state.hp = self.boss_state.max_hp
         self.boss_state.charging = False
         self.boss_state.returning_to_center = False
-        self.boss_state.emotion = "normal"
+        self.boss_state.emotion = Emotion.NORMAL
         
         # Reset player
         self.player_state.x = 200.0
@@ -615,6 +617,7 @@ class Game:
         self.player_state.hp = self.player_state.max_hp
         
         self.player_state.invincible = False
+        self.player_state.invincible_timer = 0.0
         self.player_state.berserker_active = False
         self.player_state.voidwalker_timer = 0.0
         self.player_state.reflect_charges = 3 if self.save_data["upgrades"]["reflect"] else 0
@@ -655,17 +658,17 @@ class Game:
             self.other_players = self.network_client.get_other_players()
         
         # Handle frame stepping
-        if self.admin_state.frame_step_mode and not self.admin_state.can_step:
-            return
-        
-        if self.admin_state.frame_step_mode:
-            self.admin_state.can_step = False
+        flags = self.debug_flags
+        if flags.frame_step_mode:
+            if not flags.can_step:
+                return
+            flags.can_step = False
         
         # Calculate time scaling
         scaled_dt = dt * self.game_state.time_scale
         
         # Apply ability time effects
-        if self.game_state.screen_state == "GAME" and not self.game_state.paused:
+        if self.game_state.screen_state == Screen.GAME and not self.game_state.paused:
             slow_multiplier = 1.0
             
             # Chronoking passive slow
@@ -683,7 +686,7 @@ class Game:
             scaled_dt *= slow_multiplier
         
         # Update based on state
-        if self.game_state.screen_state == "GAME" and not self.game_state.paused:
+        if self.game_state.screen_state == Screen.GAME and not self.game_state.paused:
             self._update_game(scaled_dt, dt)
         
         # Always update these
@@ -769,11 +772,8 @@ class Game:
         # Check chasing laser collision
         self._check_chasing_laser_collision()
         
-        # Update parry duration
-        if self.player_state.parry_active:
-            self.player_state.parry_duration -= raw_dt
-            if self.player_state.parry_duration <= 0:
-                self.player_state.parry_active = False
+        # Tick player timers (parry window, invincibility frames)
+        self.player_state.update(raw_dt)
         
         # Check win/lose conditions
         if self.player_state.hp <= 0:
@@ -1004,7 +1004,7 @@ class Game:
                     self.animation_manager.screen_shake(6, 0.2)
                 
                 self.animation_manager.enemy_hit_effect(px, py)
-                self.boss_state.emotion = "hurt"
+                self.boss_state.emotion = Emotion.HURT
                 
                 # FIX: Mark piercing bullets as having hit boss to prevent re-homing
                 if projectile.get("piercing"):
@@ -1041,7 +1041,7 @@ class Game:
         else:
             save_progress(self.save_data)
         
-        self.game_state.screen_state = "VICTORY"
+        self.game_state.screen_state = Screen.VICTORY
     
     def _handle_gameover(self):
         """Handle player death"""
@@ -1059,58 +1059,59 @@ class Game:
             save_multiplayer_progress(self.save_data)
             self.mp_session_damage = 0.0
         
-        self.game_state.screen_state = "GAMEOVER"
+        self.game_state.screen_state = Screen.GAMEOVER
     
     def render(self):
         """Main render loop"""
         # Apply screen shake offset during game
         shake_x, shake_y = self.animation_manager.get_shake_offset()
-        if self.game_state.screen_state == "GAME" and (shake_x or shake_y):
+        if self.game_state.screen_state == Screen.GAME and (shake_x or shake_y):
             self.screen.fill((0, 0, 0))
             game_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            game_surface.fill((8, 8, 35))
+            game_surface.fill(COLORS["background"])
             # Temporarily redirect rendering to game_surface
             original_screen = self.screen
             self.screen = game_surface
             self.renderer.screen = game_surface
         else:
-            self.screen.fill((8, 8, 35))
+            self.screen.fill(COLORS["background"])
             original_screen = None
 
-        # Render based on state
-        action = None
+        # Render based on state; button clicks are dispatched from
+        # handle_events, so the screen renders only draw
+        self.ui_manager.begin_frame()
 
-        if self.game_state.screen_state == "MENU":
-            action = self.ui_manager.render_menu(self.game_state)
+        if self.game_state.screen_state == Screen.MENU:
+            self.ui_manager.render_menu(self.game_state)
         
-        elif self.game_state.screen_state == "LEVELSELECT":
-            action = self.ui_manager.render_level_select(self.game_state)
+        elif self.game_state.screen_state == Screen.LEVELSELECT:
+            self.ui_manager.render_level_select(self.game_state)
         
-        elif self.game_state.screen_state == "SHOP_MENU":
-            action = self.ui_manager.render_shop_menu()
+        elif self.game_state.screen_state == Screen.SHOP_MENU:
+            self.ui_manager.render_shop_menu()
         
-        elif self.game_state.screen_state == "SHOP":
-            action = self.ui_manager.render_shop(self.game_state)
+        elif self.game_state.screen_state == Screen.SHOP:
+            self.ui_manager.render_shop(self.game_state)
         
-        elif self.game_state.screen_state == "ABILITY_TEMPLE":
-            action = self.ui_manager.render_ability_temple(self.game_state, self.ability_manager)
+        elif self.game_state.screen_state == Screen.ABILITY_TEMPLE:
+            self.ui_manager.render_ability_temple(self.game_state, self.ability_manager)
         
-        elif self.game_state.screen_state == "SETTINGS":
-            action = self.ui_manager.render_settings()
+        elif self.game_state.screen_state == Screen.SETTINGS:
+            self.ui_manager.render_settings()
         
-        elif self.game_state.screen_state == "ADMIN_MENU":
-            action = self.ui_manager.render_admin_menu(self.admin_state)
+        elif self.game_state.screen_state == Screen.ADMIN_MENU:
+            self.ui_manager.render_admin_menu(self.admin_state)
         
-        elif self.game_state.screen_state == "MULTIPLAYER_MENU":
-            action = self.ui_manager.render_multiplayer_menu(self.game_state)
+        elif self.game_state.screen_state == Screen.MULTIPLAYER_MENU:
+            self.ui_manager.render_multiplayer_menu(self.game_state)
         
-        elif self.game_state.screen_state == "MULTIPLAYER_LOBBY":
-            action = self.ui_manager.render_multiplayer_lobby(self.game_state)
+        elif self.game_state.screen_state == Screen.MULTIPLAYER_LOBBY:
+            self.ui_manager.render_multiplayer_lobby(self.game_state)
         
-        elif self.game_state.screen_state == "PVP_LOBBY":
-            action = self.ui_manager.render_pvp_lobby(self.game_state)
+        elif self.game_state.screen_state == Screen.PVP_LOBBY:
+            self.ui_manager.render_pvp_lobby(self.game_state)
         
-        elif self.game_state.screen_state == "GAME":
+        elif self.game_state.screen_state == Screen.GAME:
             if self.game_state.paused:
                 self.renderer.render_game(self.game_state, self.player_state, self.boss_state,
                                         self.boss_ai, self.player, self.animation_manager,
@@ -1118,7 +1119,7 @@ class Game:
                 # Render other players in multiplayer
                 if self.is_multiplayer_mode:
                     self._render_other_players()
-                action = self.ui_manager.render_pause_menu()
+                self.ui_manager.render_pause_menu()
             else:
                 self.renderer.render_game(self.game_state, self.player_state, self.boss_state,
                                         self.boss_ai, self.player, self.animation_manager,
@@ -1127,15 +1128,14 @@ class Game:
                 if self.is_multiplayer_mode:
                     self._render_other_players()
         
-        elif self.game_state.screen_state == "VICTORY":
-            action = self.ui_manager.render_victory(self.game_state)
+        elif self.game_state.screen_state == Screen.VICTORY:
+            self.ui_manager.render_victory(self.game_state)
         
-        elif self.game_state.screen_state == "GAMEOVER":
-            action = self.ui_manager.render_gameover(self.game_state)
+        elif self.game_state.screen_state == Screen.GAMEOVER:
+            self.ui_manager.render_gameover(self.game_state)
         
-        # Handle action from rendering
-        if action:
-            self._handle_ui_action(action)
+        # Draw the buttons queued by the screen above
+        self.ui_manager.end_frame()
         
         # If we used a game surface for screen shake, blit it with offset
         if original_screen is not None:
@@ -1147,7 +1147,7 @@ class Game:
         self.console.render(self.screen)
 
         # Debug stats
-        if self.admin_state.show_stats:
+        if self.debug_flags.show_stats:
             self._render_debug_stats()
 
         pygame.display.flip()
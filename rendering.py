@@ -11,6 +11,7 @@ import pygame
 import math
 import time
 import random
+from constants import Emotion
 
 class Renderer:
     """Handles all game rendering with effects"""
@@ -36,7 +37,7 @@ class Renderer:
         self._render_player_projectiles(player, animation_manager)
         
         # Render boss
-        self._render_boss(boss_state, boss_ai, player_state.x, player_state.y, game_state.level)
+        self._render_boss(boss_state, boss_ai, player_state.x, player_state.y, game_state.is_super_level)
         
         # Render player
         self._render_player(player_state, save_data, ability_manager)
@@ -136,7 +137,7 @@ class Renderer:
             else:
                 pygame.draw.circle(self.screen, (50, 255, 50), (x, y), 6)
     
-    def _render_boss(self, boss_state, boss_ai, player_x, player_y, level):
+    def _render_boss(self, boss_state, boss_ai, player_x, player_y, is_super):
         """Render 3D cube boss with effects"""
         # Project vertices
         projected = []
@@ -149,7 +150,6 @@ class Renderer:
             projected.append((px, py))
         
         # Determine color
-        is_super = level % 10 == 0
         if is_super:
             color = (255, 0, 255)
             # Super boss glow
@@ -207,7 +207,7 @@ class Renderer:
         ey = size * 0.18
         es = max(5, int(size * 0.12))
         
-        if emotion == "super" or is_super:
+        if emotion == Emotion.SUPER or is_super:
             col = (255, 0, 255)
             pygame.draw.circle(self.screen, col, (int(cx-ex), int(cy-ey)), es+10)
             pygame.draw.circle(self.screen, col, (int(cx+ex), int(cy-ey)), es+10)
@@ -215,26 +215,26 @@ class Renderer:
             pygame.draw.circle(self.screen, (255,255,0), (int(cx+ex), int(cy-ey)), es+5)
             pygame.draw.arc(self.screen, col, (cx-size*0.4, cy, size*0.8, size*0.5), 0, math.pi, 8)
         
-        elif emotion == "normal":
+        elif emotion == Emotion.NORMAL:
             col = (255,255,0)
             pygame.draw.circle(self.screen, col, (int(cx-ex), int(cy-ey)), es)
             pygame.draw.circle(self.screen, col, (int(cx+ex), int(cy-ey)), es)
             pygame.draw.arc(self.screen, col, (cx-size*0.35, cy+size*0.1, size*0.7, size*0.35), 0, math.pi, 4)
         
-        elif emotion == "angry":
+        elif emotion == Emotion.ANGRY:
             col = (255, 50, 50)
             pygame.draw.circle(self.screen, col, (int(cx-ex), int(cy-ey)), es+4)
             pygame.draw.circle(self.screen, col, (int(cx+ex), int(cy-ey)), es+4)
             pygame.draw.arc(self.screen, col, (cx-size*0.35, cy+size*0.2, size*0.7, size*0.3), math.pi, 0, 5)
         
-        elif emotion == "hurt":
+        elif emotion == Emotion.HURT:
             for sx in (-ex, ex):
                 pygame.draw.line(self.screen, (255,0,0),
                                (cx+sx-es, cy-ey-es), (cx+sx+es, cy-ey+es), 5)
                 pygame.draw.line(self.screen, (255,0,0),
                                (cx+sx+es, cy-ey-es), (cx+sx-es, cy-ey+es), 5)
         
-        elif emotion == "charging":
+        elif emotion == Emotion.CHARGING:
             col = (255,150,0)
             pygame.draw.circle(self.screen, col, (int(cx-ex), int(cy-ey)), es+8)
             pygame.draw.circle(self.screen, col, (int(cx+ex), int(cy-ey)), es+8)
@@ -338,7 +338,7 @@ class Renderer:
         self.screen.blit(hp_text, (25, 55))
         
         # Level display
-        is_super = game_state.level % 10 == 0
+        is_super = game_state.is_super_level
         level_text = f"Level {game_state.level}" + (" SUPER BOSS!" if is_super else "")
         level_color = (255,0,255) if is_super else (255,255,0)
         text = self.font_med.render(level_text, True, level_color)
@@ -346,7 +346,7 @@ class Renderer:
         
         # Boss HP bar
         pygame.draw.rect(self.screen, (60,60,60), (480,20,300,25))
-        boss_hp_pct = boss_state.hp / boss_state.max_hp if boss_state.max_hp > 0 else 0
+        boss_hp_pct = boss_state.get_hp_percent()
         if boss_hp_pct > 0.6:
             boss_color = (255, 100, 100)
         elif boss_hp_pct > 0.3:
@@ -3,10 +3,48 @@ FILE: game/states.py
 Complete game state dataclasses
 """
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import List
+from typing import Any, Callable, Deque, List, Sequence
+from constants import Screen, Emotion
 
-@dataclass
+# Boss emotion indexed by (is_super << 2) | (charging << 1) | (hp < 30%)
+_EMOTION_LUT = (
+    Emotion.NORMAL, Emotion.ANGRY, Emotion.CHARGING, Emotion.CHARGING,
+    Emotion.SUPER, Emotion.SUPER, Emotion.SUPER, Emotion.SUPER,
+)
+
+# setplayerstat stat name -> save_data["upgrades"] key
+_STAT_UPGRADE_KEYS = {"dmg": "damage", "speed": "speed", "firerate": "firerate"}
+
+CONSOLE_HISTORY_LIMIT = 256
+
+# Marks a CommandArg that has no default
+_REQUIRED = object()
+
+def _parse_bool(text: str) -> bool:
+    return text.lower() == "true"
+
+@dataclass(frozen=True, slots=True)
+class CommandArg:
+    """Positional argument spec for an admin command"""
+    name: str
+    parse: Callable[[str], Any]
+    default: Any = _REQUIRED
+
+def _parse_args(specs: Sequence[CommandArg], parts: List[str]) -> List[Any]:
+    """Convert the words after the command name according to specs"""
+    args = []
+    for i, spec in enumerate(specs, 1):
+        if i < len(parts):
+            args.append(spec.parse(parts[i]))
+        elif spec.default is _REQUIRED:
+            raise ValueError(f"missing <{spec.name}>")
+        else:
+            args.append(spec.default)
+    return args
+
+@dataclass(slots=True)
 class GameState:
     """Master game state - controls flow"""
     level: int = 1
@@ -14,16 +52,27 @@ class GameState:
     max_level: int = 1
     paused: bool = False
     time_scale: float = 1.0
-    screen_state: str = "MENU"  # MENU, GAME, SHOP, LEVELSELECT, SHOP_MENU, ABILITY_TEMPLE, SETTINGS, ADMIN_MENU, VICTORY, GAMEOVER, MULTIPLAYER_MENU, MULTIPLAYER_LOBBY, PVP_LOBBY
+    screen_state: Screen = Screen.MENU
     frame_count: int = 0
     game_time: float = 0.0
     
+    # Derived from level by set_level
+    is_super_level: bool = field(default=False, init=False)
+    
+    def __post_init__(self):
+        self.set_level(self.level)
+    
+    def set_level(self, level: int):
+        """Change level and refresh the super-level flag"""
+        self.level = level
+        self.is_super_level = level % 10 == 0
+    
     def update(self, dt: float):
         """Update game time with time scaling"""
         self.game_time += dt * self.time_scale
         self.frame_count += 1
 
-@dataclass
+@dataclass(slots=True)
 class PlayerState:
     """Player stats and state"""
     x: float = 400.0
@@ -62,29 +111,37 @@ class PlayerState:
     
     def update(self, dt: float):
         """Update player state"""
-        if self.invincible_timer > 0:
-            self.invincible_timer -= dt
-            self.invincible = self.invincible_timer > 0
+        timer = self.invincible_timer
+        if timer > 0:
+            timer -= dt
+            self.invincible_timer = timer
+            self.invincible = timer > 0
         
         if self.parry_active:
-            self.parry_duration -= dt
-            if self.parry_duration <= 0:
+            duration = self.parry_duration - dt
+            if duration <= 0:
                 self.parry_active = False
+                self.parry_duration = 0.0
+            else:
+                self.parry_duration = duration
 
-@dataclass
+@dataclass(slots=True)
 class BossState:
     """Boss stats and AI state"""
     x: float = 400.0
     y: float = 300.0
     hp: float = 500.0
-    max_hp: float = 500.0
+    # Backing fields for the max_hp property, which keeps them in sync
+    _max_hp: float = field(default=500.0, init=False)
+    _inv_max_hp: float = field(default=1.0 / 500.0, init=False, repr=False)
     phase: int = 0
     
     # AI state
     charging: bool = False
     charge_timer: float = 0.0
     charge_duration: float = 1.5
-    charge_dir: List[float] = field(default_factory=lambda: [0.0, 0.0])
+    charge_dir_x: float = 0.0
+    charge_dir_y: float = 0.0
     charge_speed: float = 0.0
     returning_to_center: bool = False
     
@@ -98,48 +155,57 @@ class BossState:
     last_spray: float = 0.0
     last_chasing: float = 0.0
     
-    emotion: str = "normal"  # normal, angry, charging, hurt, super
+    emotion: Emotion = Emotion.NORMAL
+    
+    @property
+    def max_hp(self) -> float:
+        return self._max_hp
+    
+    @max_hp.setter
+    def max_hp(self, value: float):
+        """Set max HP and refresh the cached reciprocal"""
+        self._max_hp = value
+        self._inv_max_hp = 1.0 / value if value > 0 else 0.0
     
     def get_hp_percent(self) -> float:
-        return self.hp / self.max_hp if self.max_hp > 0 else 0
+        return self.hp * self._inv_max_hp
     
-    def update(self, dt: float, game_level: int):
+    def update(self, dt: float, is_super_level: bool):
         """Update boss state"""
-        if self.charging:
-            self.charge_timer += dt
-            if self.charge_timer >= self.charge_duration:
-                self.charging = False
-                self.charge_timer = 0.0
+        charging = self.charging
+        if charging:
+            timer = self.charge_timer + dt
+            if timer >= self.charge_duration:
+                charging = self.charging = False
+                timer = 0.0
+            self.charge_timer = timer
         
-        # Update emotion based on HP
-        hp_pct = self.get_hp_percent()
-        is_super = game_level % 10 == 0
+        # Update emotion based on HP (get_hp_percent inlined)
+        low_hp = self.hp * self._inv_max_hp < 0.3
         
-        if is_super:
-            self.emotion = "super"
-        elif self.charging:
-            self.emotion = "charging"
-        elif hp_pct < 0.3:
-            self.emotion = "angry"
-        else:
-            self.emotion = "normal"
+        self.emotion = _EMOTION_LUT[(is_super_level << 2) | (charging << 1) | low_hp]
 
-@dataclass
-class AdminState:
-    """Admin/debug mode state"""
+@dataclass(slots=True)
+class DebugFlags:
+    """Debug toggles checked every frame"""
     enabled: bool = False
-    password: str = "ilovenoodledoo"
-    console_open: bool = False
-    console_history: List[str] = field(default_factory=list)
-    console_input: str = ""
-    
-    # Flags
     free_shop: bool = False
     show_stats: bool = False
     show_hitboxes: bool = False
     show_heatmap: bool = False
     frame_step_mode: bool = False
     can_step: bool = False
+
+@dataclass(slots=True)
+class AdminState:
+    """Admin console session state"""
+    password: str = "ilovenoodledoo"
+    console_open: bool = False
+    console_history: Deque[str] = field(default_factory=lambda: deque(maxlen=CONSOLE_HISTORY_LIMIT))
+    console_input: str = ""
+    
+    # Hot flags live in their own small object
+    flags: DebugFlags = field(default_factory=DebugFlags)
     
     def execute_command(self, cmd: str, game_state: 'GameState', 
                        player_state: 'PlayerState', boss_state: 'BossState',
@@ -150,107 +216,128 @@ class AdminState:
             return "No command"
         
         command = parts[0].lower()
+        entry = self._HANDLERS.get(command)
+        if entry is None:
+            return f"Unknown command: {command}"
         
+        handler, specs = entry
         try:
-            # Player commands
-            if command == "setplayerstat":
-                stat = parts[1].lower()
-                value = float(parts[2])
-                if stat == "dmg":
-                    save_data["upgrades"]["damage"] = int(value)
-                elif stat == "speed":
-                    save_data["upgrades"]["speed"] = int(value)
-                elif stat == "firerate":
-                    save_data["upgrades"]["firerate"] = int(value)
-                return f"Set {stat} to {value}"
-            
-            elif command == "healplayer":
-                amount = float(parts[1]) if len(parts) > 1 else player_state.max_hp
-                player_state.hp = min(player_state.hp + amount, player_state.max_hp)
-                return f"Healed {amount} HP"
-            
-            elif command == "killplayer":
-                player_state.hp = 0
-                return "Player killed"
-            
-            elif command == "makeplayerinvincible":
-                value = parts[1].lower() == "true" if len(parts) > 1 else True
-                player_state.invincible = value
-                player_state.invincible_timer = 999999 if value else 0
-                return f"Invincible: {value}"
-            
-            # Economy commands
-            elif command == "givemoney":
-                amount = int(parts[1])
-                game_state.coins += amount
-                save_data["coins"] = game_state.coins
-                return f"Added {amount} coins"
-            
-            elif command == "setmoney":
-                amount = int(parts[1])
-                game_state.coins = amount
-                save_data["coins"] = game_state.coins
-                return f"Set coins to {amount}"
-            
-            elif command == "makemerich":
-                game_state.coins += 999999
-                save_data["coins"] = game_state.coins
-                return "Made rich!"
-            
-            # Game control
-            elif command == "setlevel":
-                level = int(parts[1])
-                game_state.level = level
-                return f"Set level to {level}"
-            
-            elif command == "killboss":
-                boss_state.hp = 0
-                return "Boss killed"
-            
-            elif command == "skiplevel":
-                game_state.level += 1
-                game_state.max_level = max(game_state.max_level, game_state.level)
-                save_data["max_level"] = game_state.max_level
-                return f"Skipped to level {game_state.level}"
-            
-            # Debug commands
-            elif command == "showstats":
-                value = parts[1].lower() == "true" if len(parts) > 1 else not self.show_stats
-                self.show_stats = value
-                return f"Show stats: {value}"
-            
-            elif command == "framestep":
-                value = parts[1].lower() == "true" if len(parts) > 1 else not self.frame_step_mode
-                self.frame_step_mode = value
-                self.can_step = False
-                return f"Frame step mode: {value}"
-            
-            elif command == "step":
-                if self.frame_step_mode:
-                    self.can_step = True
-                    return "Stepping one frame"
-                return "Not in frame step mode"
-            
-            elif command == "timescale":
-                scale = float(parts[1])
-                game_state.time_scale = max(0.1, min(5.0, scale))
-                return f"Time scale: {game_state.time_scale}"
-            
-            # Bot commands
-            elif command == "addbot":
-                return "Bot added (requires server)"
-            
-            elif command == "removebot":
-                return "Bot removed (requires server)"
-            
-            elif command == "botcount":
-                return "Bot count: 0 (requires server)"
-            
-            elif command == "help":
-                return "Commands: setplayerstat, healplayer, givemoney, setlevel, killboss, showstats, framestep, step, timescale, addbot, removebot"
-            
-            else:
-                return f"Unknown command: {command}"
-        
+            args = _parse_args(specs, parts)
+            return handler(self, args, game_state, player_state, boss_state,
+                           save_data, ability_manager)
         except Exception as e:
             return f"Error: {str(e)}"
+    
+    # Player commands
+    def _cmd_setplayerstat(self, args, game_state, player_state, boss_state, save_data, ability_manager):
+        stat, value = args
+        key = _STAT_UPGRADE_KEYS.get(stat)
+        if key is not None:
+            save_data["upgrades"][key] = int(value)
+        return f"Set {stat} to {value}"
+    
+    def _cmd_healplayer(self, args, game_state, player_state, boss_state, save_data, ability_manager):
+        amount = args[0] if args[0] is not None else player_state.max_hp
+        player_state.hp = min(player_state.hp + amount, player_state.max_hp)
+        return f"Healed {amount} HP"
+    
+    def _cmd_killplayer(self, args, game_state, player_state, boss_state, save_data, ability_manager):
+        player_state.hp = 0
+        return "Player killed"
+    
+    def _cmd_makeplayerinvincible(self, args, game_state, player_state, boss_state, save_data, ability_manager):
+        value = args[0]
+        player_state.invincible = value
+        player_state.invincible_timer = 999999 if value else 0
+        return f"Invincible: {value}"
+    
+    # Economy commands
+    def _cmd_givemoney(self, args, game_state, player_state, boss_state, save_data, ability_manager):
+        amount = args[0]
+        game_state.coins += amount
+        save_data["coins"] = game_state.coins
+        return f"Added {amount} coins"
+    
+    def _cmd_setmoney(self, args, game_state, player_state, boss_state, save_data, ability_manager):
+        amount = args[0]
+        game_state.coins = amount
+        save_data["coins"] = game_state.coins
+        return f"Set coins to {amount}"
+    
+    def _cmd_makemerich(self, args, game_state, player_state, boss_state, save_data, ability_manager):
+        game_state.coins += 999999
+        save_data["coins"] = game_state.coins
+        return "Made rich!"
+    
+    # Game control
+    def _cmd_setlevel(self, args, game_state, player_state, boss_state, save_data, ability_manager):
+        level = args[0]
+        game_state.set_level(level)
+        return f"Set level to {level}"
+    
+    def _cmd_killboss(self, args, game_state, player_state, boss_state, save_data, ability_manager):
+        boss_state.hp = 0
+        return "Boss killed"
+    
+    def _cmd_skiplevel(self, args, game_state, player_state, boss_state, save_data, ability_manager):
+        game_state.set_level(game_state.level + 1)
+        game_state.max_level = max(game_state.max_level, game_state.level)
+        save_data["max_level"] = game_state.max_level
+        return f"Skipped to level {game_state.level}"
+    
+    # Debug commands
+    def _cmd_showstats(self, args, game_state, player_state, boss_state, save_data, ability_manager):
+        value = args[0] if args[0] is not None else not self.flags.show_stats
+        self.flags.show_stats = value
+        return f"Show stats: {value}"
+    
+    def _cmd_framestep(self, args, game_state, player_state, boss_state, save_data, ability_manager):
+        value = args[0] if args[0] is not None else not self.flags.frame_step_mode
+        self.flags.frame_step_mode = value
+        self.flags.can_step = False
+        return f"Frame step mode: {value}"
+    
+    def _cmd_step(self, args, game_state, player_state, boss_state, save_data, ability_manager):
+        if self.flags.frame_step_mode:
+            self.flags.can_step = True
+            return "Stepping one frame"
+        return "Not in frame step mode"
+    
+    def _cmd_timescale(self, args, game_state, player_state, boss_state, save_data, ability_manager):
+        game_state.time_scale = max(0.1, min(5.0, args[0]))
+        return f"Time scale: {game_state.time_scale}"
+    
+    # Bot commands
+    def _cmd_addbot(self, args, game_state, player_state, boss_state, save_data, ability_manager):
+        return "Bot added (requires server)"
+    
+    def _cmd_removebot(self, args, game_state, player_state, boss_state, save_data, ability_manager):
+        return "Bot removed (requires server)"
+    
+    def _cmd_botcount(self, args, game_state, player_state, boss_state, save_data, ability_manager):
+        return "Bot count: 0 (requires server)"
+    
+    def _cmd_help(self, args, game_state, player_state, boss_state, save_data, ability_manager):
+        return "Commands: setplayerstat, healplayer, givemoney, setlevel, killboss, showstats, framestep, step, timescale, addbot, removebot"
+    
+    # Command name -> (handler, positional argument specs), built once with the class
+    _HANDLERS = {
+        "setplayerstat": (_cmd_setplayerstat, (CommandArg("stat", str.lower), CommandArg("value", float))),
+        "healplayer": (_cmd_healplayer, (CommandArg("amount", float, None),)),
+        "killplayer": (_cmd_killplayer, ()),
+        "makeplayerinvincible": (_cmd_makeplayerinvincible, (CommandArg("value", _parse_bool, True),)),
+        "givemoney": (_cmd_givemoney, (CommandArg("amount", int),)),
+        "setmoney": (_cmd_setmoney, (CommandArg("amount", int),)),
+        "makemerich": (_cmd_makemerich, ()),
+        "setlevel": (_cmd_setlevel, (CommandArg("level", int),)),
+        "killboss": (_cmd_killboss, ()),
+        "skiplevel": (_cmd_skiplevel, ()),
+        "showstats": (_cmd_showstats, (CommandArg("value", _parse_bool, None),)),
+        "framestep": (_cmd_framestep, (CommandArg("value", _parse_bool, None),)),
+        "step": (_cmd_step, ()),
+        "timescale": (_cmd_timescale, (CommandArg("scale", float),)),
+        "addbot": (_cmd_addbot, ()),
+        "removebot": (_cmd_removebot, ()),
+        "botcount": (_cmd_botcount, ()),
+        "help": (_cmd_help, ()),
+    }
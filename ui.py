@@ -7,11 +7,150 @@ import pygame
 import math
 import time
 import random
-from typing import Optional, Dict, Any, List
+from array import array
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from functools import partial
+from itertools import islice
+from typing import Optional, Deque, Dict, Any, List, Tuple
+from constants import COLORS, Screen
+from scaling import ScalingFormulas
+
+# Surface.fblits (pygame-ce) skips building blits()' return list; fall back on pygame
+_HAS_FBLITS = hasattr(pygame.Surface, "fblits")
+
+# Upper bound on cached text surfaces; least recently used are dropped first
+TEXT_CACHE_SIZE = 512
+
+# Upper bound on cached button rects before the cache is reset
+RECT_CACHE_SIZE = 1024
+
+# Menu title bob offsets over one period (sin(2t) * 5 px, ~3.1 s), one entry per step
+TITLE_BOB_STEP_MS = 52
+_TITLE_BOB = tuple(int(math.sin(i * 2 * math.pi / 60) * 5) for i in range(60))
+
+# One sine period in 1024 steps, scaled by 1024, for UI animation;
+# _sinlut(x, amp) ~= int(math.sin(x) * amp) in whole pixels
+_SIN_LUT = array('i', [int(math.sin(2 * math.pi * i / 1024) * 1024) for i in range(1024)])
+_SIN_LUT_SCALE = 1024 / (2 * math.pi)
+
+def _sinlut(phase: float, amplitude: int) -> int:
+    return (_SIN_LUT[int(phase * _SIN_LUT_SCALE) & 1023] * amplitude) >> 10
+
+# Connection status -> lobby status text color
+_STATUS_COLORS = {
+    "disconnected": (150, 150, 150),
+    "connecting": (255, 200, 0),
+    "connected": (0, 255, 0),
+    "hosting": (100, 255, 100),
+    "error": (255, 0, 0),
+}
+
+Color = Tuple[int, int, int]
+
+@dataclass(frozen=True, slots=True)
+class LobbyTheme:
+    """What differs between the co-op and PvP lobby screens"""
+    title: str
+    title_color: Color
+    title_x: int
+    subtitle: str
+    dy: int  # vertical shift of everything below the title
+    mode: Optional[str]  # added to host/join actions when set
+    host_label: str
+    host_colors: Tuple[Color, Color]
+    join_label: str
+    join_colors: Tuple[Color, Color]
+    start_label: str
+    start_colors: Tuple[Color, Color]
+    border_color: Color
+    chat_color: Color
+    back_state: Screen
+
+COOP_LOBBY_THEME = LobbyTheme(
+    title="MULTIPLAYER", title_color=(200, 150, 255), title_x=250,
+    subtitle="", dy=0, mode=None,
+    host_label="HOST", host_colors=((0, 120, 0), (0, 180, 0)),
+    join_label="JOIN", join_colors=((0, 100, 200), (0, 150, 255)),
+    start_label="START GAME", start_colors=((150, 100, 0), (200, 150, 0)),
+    border_color=(100, 100, 150), chat_color=(200, 200, 255),
+    back_state=Screen.MENU,
+)
+
+PVP_LOBBY_THEME = LobbyTheme(
+    title="PvP MODE", title_color=(255, 100, 100), title_x=280,
+    subtitle="Player vs Player - Fight other players!", dy=40, mode="pvp",
+    host_label="HOST PvP", host_colors=((150, 0, 0), (200, 0, 0)),
+    join_label="JOIN PvP", join_colors=((200, 0, 0), (255, 50, 50)),
+    start_label="START PvP", start_colors=((200, 0, 0), (255, 50, 50)),
+    border_color=(150, 100, 100), chat_color=(255, 200, 200),
+    back_state=Screen.MULTIPLAYER_MENU,
+)
+
+# Settings rows: (label, label y, settings key, "on" value, on text, off text, action)
+SETTINGS_ITEMS = (
+    ("Theme:", 150, "theme", "dark", "Dark Mode", "Light Mode", "toggle_theme"),
+    ("Movement:", 250, "movement", "mouse", "Mouse", "Arrow Keys", "toggle_movement"),
+    ("Colorblind Mode:", 350, "colorblind", True, "ON", "OFF", "toggle_colorblind"),
+)
+
+# Shop upgrades: (name, save key, base cost, max level, description, required level)
+SHOP_ITEMS = (
+    ("Damage+", "damage", 50, 30, "Increase bullet damage", 1),
+    ("Fire Rate+", "firerate", 80, 30, "Shoot faster", 1),
+    ("Max HP+", "health", 100, 20, "Increase max health", 1),
+    ("Speed+", "speed", 60, 15, "Bullets move faster", 1),
+    ("Triple Shot", "triple", 250, 1, "Fire 3 bullets at once", 1),
+    ("Rapid Fire", "rapid", 350, 1, "Halve fire rate cooldown", 3),
+    ("Shield", "shield", 300, 1, "Block one attack", 1),
+    ("Piercing", "piercing", 400, 1, "Bullets pass through", 5),
+    ("Lifesteal", "lifesteal", 500, 1, "Heal 0.5 health per hit", 5),
+    ("Multishot+", "multishot", 150, 5, "Fire even more shots", 3),
+    ("Critical Hit", "crit", 450, 1, "25% chance 2x damage", 7),
+    ("Regeneration", "regen", 600, 1, "Heal 2 HP every 2s", 7),
+    ("Ultra Damage", "ultradamage", 800, 10, "MASSIVE damage boost", 10),
+    ("Mega Shield", "megashield", 1200, 1, "Block THREE attacks", 10),
+    ("Time Slow", "timeslow", 1500, 1, "50% slower enemies", 12),
+    ("Explosive", "explosive", 2000, 1, "Bullets explode on hit", 15),
+    ("Vampire", "vampire", 2500, 1, "Heal 1 per hit", 15),
+    ("Berserker", "berserker", 3000, 1, "2x damage under 30% HP", 20),
+    ("Golden Heart", "goldenheart", 1000, 10, "+50 max HP per level", 20),
+    ("Laser Null", "lasernull", 4000, 1, "50% laser dodge chance", 25),
+    ("God Mode", "godmode", 10000, 1, "Start with 500 HP", 30),
+    ("Reflect", "reflect", 5000, 1, "Reflect 3 attacks/level", 30),
+    ("Immortal", "immortal", 25000, 1, "Survive lethal damage once", 40),
+    ("Berserker Squared", "berserker_sqr", 10000, 1, "Damage ^1.5 at <10% HP", 40),
+    ("Nuclear Shot", "nuclearshot", 30000, 1, "Massive explosions", 45),
+    ("Infinite Ammo", "infiniteammo", 20000, 1, "No fire rate cooldown", 50),
+    ("Titan Shield", "titanshield", 35000, 1, "Block FIVE attacks", 50),
+    ("Voidwalker", "voidwalker", 50000, 1, "5s invincibility every 30s", 60),
+    ("Parry", "parry", 2000, 1, "Reflect attacks with Spacebar", 15),
+    ("Bullet Storm", "bulletstorm", 1500, 1, "Rapid-fire bullet output", 12),
+    ("Homing Rounds", "homingrounds", 3500, 1, "Bullets auto-home to boss", 18),
+)
 
 class UIManager:
     """Manages all UI rendering and interactions"""
     
+    __slots__ = (
+        "screen", "save_data",
+        "font_big", "font_med", "font_small", "font_tiny",
+        "level_scroll", "shop_scroll", "admin_input",
+        "rolling", "roll_start", "roll_duration",
+        "server_ip_input", "server_port_input", "player_name_input",
+        "lobby_scroll", "chat_input", "chat_messages", "active_input_field",
+        "connection_status", "connection_error", "players_in_lobby",
+        # Render caches and per-frame state
+        "_text_cache", "_shop_static_cache", "_glyph_atlas", "_lobby_panels",
+        "_button_surf_cache", "_rect_cache", "_frame_blits", "_field_bg_cache", "_cursor_surf",
+        "_admin_box", "_mask_cache", "_pause_overlay", "_scene_cache", "_lvl_label_surfs",
+        "_podium_surf", "_dot_cache", "_glow_cache", "_stacks_cache", "_roll_label_cache",
+        "_mouse_pos", "_blink_on", "_click_targets",
+        "_chat_surface", "_chat_color", "_chat_dirty",
+        "_players_panel", "_players_dirty", "_lobby_player_labels",
+        "_status_surf", "_error_surf",
+    )
+    
     def __init__(self, screen, save_data):
         self.screen = screen
         self.save_data = save_data
@@ -21,6 +160,60 @@ class UIManager:
         self.font_small = pygame.font.Font(None, 30)
         self.font_tiny = pygame.font.Font(None, 24)
         
+        # (font id, text, color) -> rendered surface
+        self._text_cache: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        # Shop key -> (name, locked name, lock notice, description) surfaces
+        self._shop_static_cache: Dict[str, tuple] = {}
+        # (font id, char code, color) -> (glyph surface, advance width)
+        self._glyph_atlas: Dict[tuple, tuple] = {}
+        for code in range(32, 127):
+            self._glyph(self.font_tiny, chr(code), (255, 255, 255))
+        
+        # Pre-baked lobby panels (player list, chat) keyed by theme border color
+        self._lobby_panels: Dict[Color, tuple] = {
+            theme.border_color: (self._make_panel(300, 200, theme.border_color),
+                                 self._make_panel(380, 200, theme.border_color))
+            for theme in (COOP_LOBBY_THEME, PVP_LOBBY_THEME)
+        }
+        
+        # (w, h, color) -> button background with border
+        self._button_surf_cache: Dict[tuple, pygame.Surface] = {}
+        # (x, y, w, h) -> button rect; shared with click targets, never mutated
+        self._rect_cache: Dict[tuple, pygame.Rect] = {}
+        # (surface, dest) blits queued by a screen render, drawn by end_frame()
+        self._frame_blits: List[tuple] = []
+        # Input field backgrounds keyed by (width, active), text cursor, admin password box
+        self._field_bg_cache: Dict[tuple, pygame.Surface] = {}
+        self._cursor_surf = pygame.Surface((2, 21))
+        self._cursor_surf.fill((255, 255, 255))
+        self._admin_box = self._make_panel(300, 50, (255, 255, 255), fill=(40, 40, 40), border=3)
+        self._mask_cache: List[pygame.Surface] = []  # index is password length
+        # Temple podium: top cap, body, base (top-left is 10px above the body)
+        self._podium_surf = pygame.Surface((100, 50))
+        self._podium_surf.fill((100, 100, 150), (0, 10, 100, 20))
+        self._podium_surf.fill((150, 150, 200), (5, 0, 90, 10))
+        self._podium_surf.fill((80, 80, 100), (0, 30, 100, 20))
+        self._podium_surf.set_colorkey((0, 0, 0))
+        # Temple particle dots and glow outlines keyed by rarity color
+        self._dot_cache: Dict[tuple, pygame.Surface] = {}
+        self._glow_cache: Dict[tuple, pygame.Surface] = {}
+        # Temple labels keyed by stack count and by roll cost
+        self._stacks_cache: Dict[int, pygame.Surface] = {}
+        self._roll_label_cache: Dict[int, pygame.Surface] = {}
+        # Half-transparent black dimming the game behind the pause menu
+        self._pause_overlay = pygame.Surface((800, 600))
+        self._pause_overlay.set_alpha(128)
+        self._pause_overlay.fill((0, 0, 0))
+        # Scene name -> ((key, hovered targets), composed surface, click targets)
+        self._scene_cache: Dict[str, tuple] = {}
+        # Level-select button labels; index is level - 1, grown with max_level
+        self._lvl_label_surfs: List[pygame.Surface] = []
+        
+        # Mouse position sampled once per frame by begin_frame()
+        self._mouse_pos = (0, 0)
+        # Input cursor blink phase, flips every 512 ms
+        self._blink_on = True
+        
         self.level_scroll = 0
         self.shop_scroll = 0
         self.admin_input = ""
@@ -36,58 +229,232 @@ class UIManager:
         self.player_name_input = "Player"
         self.lobby_scroll = 0
         self.chat_input = ""
-        self.chat_messages: List[tuple] = []  # (sender, message, timestamp)
+        self.chat_messages: Deque[tuple] = deque(maxlen=50)  # (sender, message, timestamp)
         self.active_input_field = None  # "ip", "port", "name", "chat"
         
-        # Connection status
-        self.connection_status = "disconnected"
-        self.connection_error = ""
-        self.players_in_lobby: List[Dict] = []
+        # Composed last-6 chat lines, rebuilt when messages or text color change
+        self._chat_surface: Optional[pygame.Surface] = None
+        self._chat_color = None
+        self._chat_dirty = True
         
-        # Button click tracking (to prevent multiple triggers per frame)
-        self.mouse_was_pressed = False
-        self.frame_click_processed = False  # Track if we've processed a click this frame
+        # Connection status (also builds the status/error surfaces)
+        self.set_connection_status("disconnected")
+        self.players_in_lobby: List[Dict] = []
+        # (label, color) per shown player, formatted by set_lobby_players
+        self._lobby_player_labels: List[tuple] = []
+        # Composed player-list rows, rebuilt after set_lobby_players
+        self._players_panel: Optional[pygame.Surface] = None
+        self._players_dirty = True
+        
+        # (rect, action) for every clickable widget drawn this frame; action is
+        # an action dict or a callable returning one (or None)
+        self._click_targets: List[tuple] = []
+    
+    def _text(self, font, text: str, color) -> pygame.Surface:
+        """Return an antialiased text surface, rendering it only on a cache miss"""
+        key = (id(font), text, color)
+        cache = self._text_cache
+        surf = cache.get(key)
+        if surf is None:
+            surf = font.render(text, True, color)
+            cache[key] = surf
+            if len(cache) > TEXT_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return surf
+    
+    @staticmethod
+    def _make_panel(w: int, h: int, border_color, fill=(30, 30, 50), border: int = 2) -> pygame.Surface:
+        """Build a filled panel surface with a border"""
+        surf = pygame.Surface((w, h))
+        surf.fill(fill)
+        pygame.draw.rect(surf, border_color, surf.get_rect(), border)
+        return surf
+    
+    def _dot(self, color) -> pygame.Surface:
+        """Return a radius-2 particle dot; blit it at (x - 2, y - 2) to center it on (x, y)"""
+        dot = self._dot_cache.get(color)
+        if dot is None:
+            dot = self._dot_cache[color] = pygame.Surface((4, 4))
+            dot.set_colorkey((0, 0, 0))
+            pygame.draw.circle(dot, color, (2, 2), 2)
+        return dot
+    
+    def _glow(self, color) -> pygame.Surface:
+        """Return the 130x90 temple glow outline for a rarity color"""
+        glow = self._glow_cache.get(color)
+        if glow is None:
+            glow = self._glow_cache[color] = pygame.Surface((130, 90), pygame.SRCALPHA)
+            pygame.draw.rect(glow, color, glow.get_rect(), 3)
+        return glow
+    
+    def _glyph(self, font, ch: str, color) -> tuple:
+        """Return (surface, advance) for one character from the glyph atlas"""
+        key = (id(font), ord(ch), color)
+        entry = self._glyph_atlas.get(key)
+        if entry is None:
+            entry = self._glyph_atlas[key] = (font.render(ch, True, color), font.size(ch)[0])
+        return entry
+    
+    def begin_frame(self):
+        """Sample per-frame input state shared by every widget on screen"""
+        self._mouse_pos = pygame.mouse.get_pos()
+        self._blink_on = not (pygame.time.get_ticks() >> 9) & 1
+        self._click_targets.clear()
+    
+    def _focus_field(self, field_id: str):
+        """Make an input field receive keyboard input"""
+        self.active_input_field = field_id
+    
+    def _set_level_scroll(self, value: int):
+        """Jump the level-select grid to a scroll offset"""
+        self.level_scroll = value
+    
+    def _start_roll(self) -> Dict:
+        """Start the temple roll animation and request a roll"""
+        self.rolling = True
+        self.roll_start = time.time()
+        return {"type": "roll_temple"}
+    
+    def _lobby_port(self) -> int:
+        """Port typed in the lobby, or the default when the field is empty"""
+        return int(self.server_port_input) if self.server_port_input else 5555
+    
+    def _host_game(self, mode: Dict) -> Dict:
+        """Request hosting a lobby on the typed port"""
+        return {"type": "host_game", "port": self._lobby_port(), "name": self.player_name_input, **mode}
+    
+    def _join_game(self, mode: Dict) -> Dict:
+        """Request joining the typed server"""
+        return {"type": "connect_to_server", "ip": self.server_ip_input or "127.0.0.1",
+                "port": self._lobby_port(), "name": self.player_name_input, **mode}
+    
+    def _leave_temple(self, ability_manager) -> Dict:
+        """Reset the session roll count and return to the menu"""
+        ability_manager.rolls_this_session = 0
+        return {"type": "change_state", "state": Screen.MENU}
+    
+    def _leave_admin(self) -> Dict:
+        """Clear the password field and return to settings"""
+        self.admin_input = ""
+        return {"type": "change_state", "state": Screen.SETTINGS}
+    
+    def _cached_scene(self, name: str, key, draw):
+        """Queue a pre-composed full-screen scene, re-running draw() only when
+        key or the hovered button changes. draw() queues blits and click
+        targets like a normal render; they are captured into the cache."""
+        entry = self._scene_cache.get(name)
+        if entry is not None:
+            mouse = self._mouse_pos
+            hovered = tuple(i for i, (rect, _) in enumerate(entry[2]) if rect.collidepoint(mouse))
+            if entry[0] == (key, hovered):
+                self._click_targets.extend(entry[2])
+                self._frame_blits.append((entry[1], (0, 0)))
+                return
+        
+        queue, targets = self._frame_blits, self._click_targets
+        q0, t0 = len(queue), len(targets)
+        draw()
+        scene = pygame.Surface(self.screen.get_size())
+        scene.fill(COLORS["background"])
+        scene.blits(queue[q0:], doreturn=0)
+        del queue[q0:]
+        scene_targets = targets[t0:]
+        mouse = self._mouse_pos
+        hovered = tuple(i for i, (rect, _) in enumerate(scene_targets) if rect.collidepoint(mouse))
+        self._scene_cache[name] = ((key, hovered), scene, scene_targets)
+        queue.append((scene, (0, 0)))
+    
+    def end_frame(self):
+        """Draw everything the screen render queued, in order, in one call"""
+        if self._frame_blits:
+            if _HAS_FBLITS:
+                self.screen.fblits(self._frame_blits)
+            else:
+                self.screen.blits(self._frame_blits, doreturn=0)
+            self._frame_blits.clear()
     
     def set_connection_status(self, status: str, error: str = ""):
         """Update connection status display"""
         self.connection_status = status
         self.connection_error = error
+        color = _STATUS_COLORS.get(status, (150, 150, 150))
+        self._status_surf = self.font_small.render(f"Status: {status.upper()}", True, color)
+        self._error_surf = self.font_tiny.render(error, True, (255, 100, 100)) if error else None
     
     def set_lobby_players(self, players: List[Dict]):
         """Update player list in lobby"""
         self.players_in_lobby = players
+        self._lobby_player_labels = [
+            (f"{'[HOST] ' if p.get('is_host', False) else ''}{p.get('name', 'Unknown')}"
+             f"{' (Ready)' if p.get('ready', False) else ''}",
+             (0, 255, 0) if p.get("ready", False) else (200, 200, 200))
+            for p in players[:6]
+        ]
+        self._players_dirty = True
+    
+    def _player_lines(self) -> pygame.Surface:
+        """Return the lobby roster (first 6 players) as one surface"""
+        if self._players_dirty:
+            lines = [self._text(self.font_tiny, label, color) for label, color in self._lobby_player_labels]
+            # Sized to the widest row so long names are not clipped
+            width = max((line.get_width() for line in lines), default=1)
+            surf = pygame.Surface((width, 6 * 25), pygame.SRCALPHA)
+            y = 0
+            for line in lines:
+                surf.blit(line, (0, y))
+                y += 25
+            self._players_panel = surf
+            self._players_dirty = False
+        return self._players_panel
     
     def add_chat_message(self, sender: str, message: str):
         """Add chat message to display"""
+        # Keeps the last 50 messages
         self.chat_messages.append((sender, message, time.time()))
-        # Keep last 50 messages
-        if len(self.chat_messages) > 50:
-            self.chat_messages.pop(0)
+        self._chat_dirty = True
+    
+    def _chat_lines(self, color) -> pygame.Surface:
+        """Return the recent chat lines as one surface, re-rendering only on change"""
+        if self._chat_dirty or self._chat_color != color:
+            surf = pygame.Surface((370, 6 * 22), pygame.SRCALPHA)
+            y = 0
+            messages = self.chat_messages
+            for sender, msg, timestamp in islice(messages, max(0, len(messages) - 6), None):
+                surf.blit(self.font_tiny.render(f"{sender}: {msg}", True, color), (0, y))
+                y += 22
+            self._chat_surface = surf
+            self._chat_color = color
+            self._chat_dirty = False
+        return self._chat_surface
     
     def handle_event(self, event, game_state, player_state, boss_state, ability_manager, save_data):
         """Handle UI events, return action dict if any"""
-        # Reset button state tracking on mouse button up
-        if event.type == pygame.MOUSEBUTTONUP:
-            self.mouse_was_pressed = False
-            self.frame_click_processed = False
+        # Clicks resolve against the widgets drawn last frame, first hit wins
+        if event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+            for rect, action in self._click_targets:
+                if rect.collidepoint(event.pos):
+                    self._click_targets.clear()
+                    return action() if callable(action) else action
         
         # Scroll handling
         if event.type == pygame.MOUSEWHEEL:
-            if game_state.screen_state == "LEVELSELECT":
+            if game_state.screen_state == Screen.LEVELSELECT:
                 self.level_scroll -= event.y * 30
                 max_scroll = max(0, ((game_state.max_level - 1) // 5) * 100 - 300)
                 self.level_scroll = max(0, min(self.level_scroll, max_scroll))
             
-            elif game_state.screen_state == "SHOP":
+            elif game_state.screen_state == Screen.SHOP:
                 self.shop_scroll -= event.y * 30
                 self.shop_scroll = max(0, min(self.shop_scroll, 1900))
             
-            elif game_state.screen_state == "MULTIPLAYER_LOBBY":
+            elif game_state.screen_state == Screen.MULTIPLAYER_LOBBY:
                 self.lobby_scroll -= event.y * 20
                 self.lobby_scroll = max(0, self.lobby_scroll)
         
         # Admin password input
-        if game_state.screen_state == "ADMIN_MENU" and event.type == pygame.KEYDOWN:
+        if game_state.screen_state == Screen.ADMIN_MENU and event.type == pygame.KEYDOWN:
             if event.key == pygame.K_BACKSPACE:
                 self.admin_input = self.admin_input[:-1]
             elif event.key == pygame.K_RETURN:
@@ -96,14 +463,14 @@ class UIManager:
                     from config import save_progress
                     save_progress(save_data)
                     self.admin_input = ""
-                    return {"type": "change_state", "state": "MENU"}
+                    return {"type": "change_state", "state": Screen.MENU}
                 else:
                     self.admin_input = ""
             elif len(self.admin_input) < 20 and event.unicode.isprintable():
                 self.admin_input += event.unicode
         
         # Multiplayer lobby input (only when a field is active)
-        if game_state.screen_state in ["MULTIPLAYER_LOBBY", "PVP_LOBBY"] and event.type == pygame.KEYDOWN and self.active_input_field:
+        if game_state.screen_state in (Screen.MULTIPLAYER_LOBBY, Screen.PVP_LOBBY) and event.type == pygame.KEYDOWN and self.active_input_field:
             return self._handle_lobby_input(event)
         
         return None
@@ -127,7 +494,7 @@ class UIManager:
                 self.active_input_field = "name"
             elif event.key == pygame.K_RETURN:
                 return {"type": "connect_to_server", "ip": self.server_ip_input, "port": int(self.server_port_input)}
-            elif event.unicode.isdigit() and len(self.server_port_input) < 5:
+            elif event.unicode and event.unicode in "0123456789" and len(self.server_port_input) < 5:
                 self.server_port_input += event.unicode
         
         elif self.active_input_field == "name":
@@ -154,434 +521,243 @@ class UIManager:
     
     def render_menu(self, game_state):
         """Render main menu"""
-        # Reset frame click tracking and update mouse state at start of render
-        self.frame_click_processed = False
-        current_mouse_pressed = pygame.mouse.get_pressed()[0]
-        if not current_mouse_pressed:
-            self.mouse_was_pressed = False
-        
-        title_y = 100 + math.sin(time.time() * 2) * 5
-        title = self.font_big.render("CUBE BOSS FIGHT", True, (255, 215, 0))
-        self.screen.blit(title, (200, int(title_y)))
-        
-        coins = self.font_med.render(f"Coins: {game_state.coins}", True, (255, 215, 0))
-        self.screen.blit(coins, (308, 180))
-        
-        max_lv = self.font_small.render(f"Max Level: {game_state.max_level}", True, (150, 255, 150))
-        self.screen.blit(max_lv, (310, 220))
-        
-        # Check all buttons (using elif prevents multiple triggers)
-        if self._button("LEVEL SELECT", 300, 280, 200, 60, (0, 100, 200), (0, 150, 255)):
-            self.mouse_was_pressed = current_mouse_pressed
-            return {"type": "change_state", "state": "LEVELSELECT"}
-        if self._button("SHOP", 300, 360, 200, 60, (0, 100, 200), (0, 150, 255)):
-            self.mouse_was_pressed = current_mouse_pressed
-            return {"type": "change_state", "state": "SHOP_MENU"}
-        if self._button("MULTIPLAYER", 300, 440, 200, 60, (100, 50, 150), (150, 80, 200)):
-            self.mouse_was_pressed = current_mouse_pressed
-            return {"type": "change_state", "state": "MULTIPLAYER_MENU"}
-        if self._button("SETTINGS", 50, 500, 150, 60, (0, 100, 200), (0, 150, 255)):
-            self.mouse_was_pressed = current_mouse_pressed
-            return {"type": "change_state", "state": "SETTINGS"}
-        if self._button("RESET GAME", 600, 500, 150, 60, (150, 0, 0), (255, 0, 0)):
-            self.mouse_was_pressed = current_mouse_pressed
-            return {"type": "reset_save"}
-        
-        # Update mouse state at end of frame for next frame
-        self.mouse_was_pressed = current_mouse_pressed
-        return None
+        self._cached_scene("menu", (game_state.coins, game_state.max_level),
+                           partial(self._draw_menu, game_state))
+        
+        # The bobbing title is the only per-frame element
+        title_y = 100 + _TITLE_BOB[(pygame.time.get_ticks() // TITLE_BOB_STEP_MS) % len(_TITLE_BOB)]
+        title = self._text(self.font_big, "CUBE BOSS FIGHT", (255, 215, 0))
+        self._frame_blits.append((title, (200, title_y)))
+    
+    def _draw_menu(self, game_state):
+        """Queue the static part of the main menu"""
+        queue = self._frame_blits.append
+        coins = self._text(self.font_med, f"Coins: {game_state.coins}", (255, 215, 0))
+        queue((coins, (308, 180)))
+        
+        max_lv = self._text(self.font_small, f"Max Level: {game_state.max_level}", (150, 255, 150))
+        queue((max_lv, (310, 220)))
+        
+        # Buttons
+        self._button("LEVEL SELECT", 300, 280, 200, 60, (0, 100, 200), (0, 150, 255), action={"type": "change_state", "state": Screen.LEVELSELECT})
+        self._button("SHOP", 300, 360, 200, 60, (0, 100, 200), (0, 150, 255), action={"type": "change_state", "state": Screen.SHOP_MENU})
+        self._button("MULTIPLAYER", 300, 440, 200, 60, (100, 50, 150), (150, 80, 200), action={"type": "change_state", "state": Screen.MULTIPLAYER_MENU})
+        self._button("SETTINGS", 50, 500, 150, 60, (0, 100, 200), (0, 150, 255), action={"type": "change_state", "state": Screen.SETTINGS})
+        self._button("RESET GAME", 600, 500, 150, 60, (150, 0, 0), (255, 0, 0), action={"type": "reset_save"})
     
     def render_multiplayer_menu(self, game_state):
         """Render multiplayer menu screen"""
-        # Reset frame click tracking and update mouse state at start of render
-        self.frame_click_processed = False
-        current_mouse_pressed = pygame.mouse.get_pressed()[0]
-        if not current_mouse_pressed:
-            self.mouse_was_pressed = False
-        
-        title = self.font_big.render("MULTIPLAYER", True, (200, 150, 255))
-        self.screen.blit(title, (250, 30))
+        self._cached_scene("multiplayer_menu", (), self._draw_multiplayer_menu)
+    
+    def _draw_multiplayer_menu(self):
+        """Queue the multiplayer menu"""
+        queue = self._frame_blits.append
+        title = self._text(self.font_big, "MULTIPLAYER", (200, 150, 255))
+        queue((title, (250, 30)))
         
-        subtitle = self.font_small.render("Choose a mode:", True, (200, 200, 200))
-        self.screen.blit(subtitle, (300, 100))
+        subtitle = self._text(self.font_small, "Choose a mode:", (200, 200, 200))
+        queue((subtitle, (300, 100)))
         
         # Co-op mode (boss fight together)
-        if self._button("CO-OP MODE", 300, 180, 200, 60, (100, 50, 150), (150, 80, 200)):
-            self.mouse_was_pressed = current_mouse_pressed
-            return {"type": "change_state", "state": "MULTIPLAYER_LOBBY", "mode": "coop"}
+        self._button("CO-OP MODE", 300, 180, 200, 60, (100, 50, 150), (150, 80, 200), action={"type": "change_state", "state": Screen.MULTIPLAYER_LOBBY, "mode": "coop"})
         
         # PvP mode (players fight each other)
-        if self._button("PvP MODE", 300, 260, 200, 60, (150, 50, 50), (200, 80, 80)):
-            self.mouse_was_pressed = current_mouse_pressed
-            return {"type": "change_state", "state": "PVP_LOBBY", "mode": "pvp"}
+        self._button("PvP MODE", 300, 260, 200, 60, (150, 50, 50), (200, 80, 80), action={"type": "change_state", "state": Screen.PVP_LOBBY, "mode": "pvp"})
         
         # Back button
-        if self._button("BACK", 300, 400, 200, 60, (150, 0, 0), (200, 0, 0)):
-            self.mouse_was_pressed = current_mouse_pressed
-            return {"type": "change_state", "state": "MENU"}
-        
-        # Update mouse state at end of frame
-        self.mouse_was_pressed = current_mouse_pressed
-        return None
+        self._button("BACK", 300, 400, 200, 60, (150, 0, 0), (200, 0, 0), action={"type": "change_state", "state": Screen.MENU})
     
     def render_multiplayer_lobby(self, game_state):
         """Render multiplayer lobby screen"""
-        # Reset frame click tracking and update mouse state at start of render
-        self.frame_click_processed = False
-        current_mouse_pressed = pygame.mouse.get_pressed()[0]
-        if not current_mouse_pressed:
-            self.mouse_was_pressed = False
-        
-        title = self.font_big.render("MULTIPLAYER", True, (200, 150, 255))
-        self.screen.blit(title, (250, 30))
-        
-        # Connection status
-        status_color = {
-            "disconnected": (150, 150, 150),
-            "connecting": (255, 200, 0),
-            "connected": (0, 255, 0),
-            "hosting": (100, 255, 100),
-            "error": (255, 0, 0)
-        }.get(self.connection_status, (150, 150, 150))
-        
-        status_text = self.font_small.render(f"Status: {self.connection_status.upper()}", True, status_color)
-        self.screen.blit(status_text, (50, 90))
-        
-        if self.connection_error:
-            error_text = self.font_tiny.render(self.connection_error, True, (255, 100, 100))
-            self.screen.blit(error_text, (50, 115))
-        
-        # Server input fields
-        self._render_input_field("Server IP:", self.server_ip_input, 50, 150, 300, "ip")
-        self._render_input_field("Port:", self.server_port_input, 370, 150, 80, "port")
-        self._render_input_field("Name:", self.player_name_input, 470, 150, 150, "name")
-        
-        # Connect/Host buttons
-        if self._button("HOST", 50, 210, 120, 50, (0, 120, 0), (0, 180, 0)):
-            self.mouse_was_pressed = current_mouse_pressed
-            return {"type": "host_game", "port": int(self.server_port_input) if self.server_port_input else 5555, "name": self.player_name_input}
-        
-        if self._button("JOIN", 190, 210, 120, 50, (0, 100, 200), (0, 150, 255)):
-            self.mouse_was_pressed = current_mouse_pressed
-            return {"type": "connect_to_server", "ip": self.server_ip_input or "127.0.0.1", "port": int(self.server_port_input) if self.server_port_input else 5555, "name": self.player_name_input}
-        
-        if self._button("DISCONNECT", 330, 210, 150, 50, (150, 0, 0), (200, 0, 0)):
-            self.mouse_was_pressed = current_mouse_pressed
-            return {"type": "disconnect"}
-        
-        # Player list
-        pygame.draw.rect(self.screen, (30, 30, 50), (50, 280, 300, 200))
-        pygame.draw.rect(self.screen, (100, 100, 150), (50, 280, 300, 200), 2)
-        
-        players_title = self.font_small.render("Players in Lobby:", True, (255, 255, 255))
-        self.screen.blit(players_title, (60, 285))
-        
-        y = 315
-        for player in self.players_in_lobby[:6]:
-            name = player.get("name", "Unknown")
-            ready = player.get("ready", False)
-            is_host = player.get("is_host", False)
-            
-            color = (0, 255, 0) if ready else (200, 200, 200)
-            prefix = "[HOST] " if is_host else ""
-            suffix = " (Ready)" if ready else ""
-            
-            player_text = self.font_tiny.render(f"{prefix}{name}{suffix}", True, color)
-            self.screen.blit(player_text, (60, y))
-            y += 25
-        
-        # Chat area
-        pygame.draw.rect(self.screen, (30, 30, 50), (370, 280, 380, 200))
-        pygame.draw.rect(self.screen, (100, 100, 150), (370, 280, 380, 200), 2)
-        
-        chat_title = self.font_small.render("Chat:", True, (255, 255, 255))
-        self.screen.blit(chat_title, (380, 285))
-        
-        # Chat messages
-        y = 310
-        for sender, msg, timestamp in self.chat_messages[-6:]:
-            chat_text = self.font_tiny.render(f"{sender}: {msg}", True, (200, 200, 255))
-            self.screen.blit(chat_text, (380, y))
-            y += 22
-        
-        # Chat input
-        self._render_input_field("", self.chat_input, 370, 450, 380, "chat")
-        
-        # Ready/Start buttons
-        if self._button("READY", 50, 500, 120, 50, (0, 100, 0), (0, 150, 0)):
-            self.mouse_was_pressed = current_mouse_pressed
-            return {"type": "ready"}
-        
-        if self._button("START GAME", 190, 500, 160, 50, (150, 100, 0), (200, 150, 0)):
-            self.mouse_was_pressed = current_mouse_pressed
-            return {"type": "start_multiplayer_game"}
-        
-        if self._button("BACK", 600, 500, 150, 50, (150, 0, 0), (200, 0, 0)):
-            self.mouse_was_pressed = current_mouse_pressed
-            return {"type": "change_state", "state": "MENU"}
-        
-        # Update mouse state at end of frame
-        self.mouse_was_pressed = current_mouse_pressed
-        return None
+        self._render_lobby(game_state, COOP_LOBBY_THEME)
     
     def render_pvp_lobby(self, game_state):
         """Render PvP lobby screen (similar to multiplayer lobby but for PvP)"""
-        # Reset frame click tracking and update mouse state at start of render
-        self.frame_click_processed = False
-        current_mouse_pressed = pygame.mouse.get_pressed()[0]
-        if not current_mouse_pressed:
-            self.mouse_was_pressed = False
+        self._render_lobby(game_state, PVP_LOBBY_THEME)
+    
+    def _render_lobby(self, game_state, theme: 'LobbyTheme'):
+        """Render a lobby screen; theme supplies the co-op/PvP differences"""
+        queue = self._frame_blits.append
+        title = self._text(self.font_big, theme.title, theme.title_color)
+        queue((title, (theme.title_x, 30)))
         
-        title = self.font_big.render("PvP MODE", True, (255, 100, 100))
-        self.screen.blit(title, (280, 30))
+        if theme.subtitle:
+            subtitle = self._text(self.font_small, theme.subtitle, (200, 200, 200))
+            queue((subtitle, (200, 90)))
         
-        subtitle = self.font_small.render("Player vs Player - Fight other players!", True, (200, 200, 200))
-        self.screen.blit(subtitle, (200, 90))
+        # Everything below the title shifts down by theme.dy
+        dy = theme.dy
+        mode = {"mode": theme.mode} if theme.mode else {}
         
         # Connection status
-        status_color = {
-            "disconnected": (150, 150, 150),
-            "connecting": (255, 200, 0),
-            "connected": (0, 255, 0),
-            "hosting": (100, 255, 100),
-            "error": (255, 0, 0)
-        }.get(self.connection_status, (150, 150, 150))
-        
-        status_text = self.font_small.render(f"Status: {self.connection_status.upper()}", True, status_color)
-        self.screen.blit(status_text, (50, 130))
-        
-        if self.connection_error:
-            error_text = self.font_tiny.render(self.connection_error, True, (255, 100, 100))
-            self.screen.blit(error_text, (50, 155))
+        queue((self._status_surf, (50, 90 + dy)))
+        if self._error_surf is not None:
+            queue((self._error_surf, (50, 115 + dy)))
         
         # Server input fields
-        self._render_input_field("Server IP:", self.server_ip_input, 50, 190, 300, "ip")
-        self._render_input_field("Port:", self.server_port_input, 370, 190, 80, "port")
-        self._render_input_field("Name:", self.player_name_input, 470, 190, 150, "name")
+        self._render_input_field("Server IP:", self.server_ip_input, 50, 150 + dy, 300, "ip")
+        self._render_input_field("Port:", self.server_port_input, 370, 150 + dy, 80, "port")
+        self._render_input_field("Name:", self.player_name_input, 470, 150 + dy, 150, "name")
         
         # Connect/Host buttons
-        if self._button("HOST PvP", 50, 250, 120, 50, (150, 0, 0), (200, 0, 0)):
-            self.mouse_was_pressed = current_mouse_pressed
-            return {"type": "host_game", "port": int(self.server_port_input) if self.server_port_input else 5555, "name": self.player_name_input, "mode": "pvp"}
+        self._button(theme.host_label, 50, 210 + dy, 120, 50, *theme.host_colors, action=partial(self._host_game, mode))
+        
+        self._button(theme.join_label, 190, 210 + dy, 120, 50, *theme.join_colors, action=partial(self._join_game, mode))
         
-        if self._button("JOIN PvP", 190, 250, 120, 50, (200, 0, 0), (255, 50, 50)):
-            self.mouse_was_pressed = current_mouse_pressed
-            return {"type": "connect_to_server", "ip": self.server_ip_input or "127.0.0.1", "port": int(self.server_port_input) if self.server_port_input else 5555, "name": self.player_name_input, "mode": "pvp"}
+        self._button("DISCONNECT", 330, 210 + dy, 150, 50, (150, 0, 0), (200, 0, 0), action={"type": "disconnect"})
         
-        if self._button("DISCONNECT", 330, 250, 150, 50, (150, 0, 0), (200, 0, 0)):
-            self.mouse_was_pressed = current_mouse_pressed
-            return {"type": "disconnect"}
+        panel_players, panel_chat = self._lobby_panels[theme.border_color]
         
         # Player list
-        pygame.draw.rect(self.screen, (30, 30, 50), (50, 320, 300, 200))
-        pygame.draw.rect(self.screen, (150, 100, 100), (50, 320, 300, 200), 2)
+        queue((panel_players, (50, 280 + dy)))
         
-        players_title = self.font_small.render("Players in Lobby:", True, (255, 255, 255))
-        self.screen.blit(players_title, (60, 325))
+        players_title = self._text(self.font_small, "Players in Lobby:", (255, 255, 255))
+        queue((players_title, (60, 285 + dy)))
         
-        y = 355
-        for player in self.players_in_lobby[:6]:
-            name = player.get("name", "Unknown")
-            ready = player.get("ready", False)
-            is_host = player.get("is_host", False)
-            
-            color = (0, 255, 0) if ready else (200, 200, 200)
-            prefix = "[HOST] " if is_host else ""
-            suffix = " (Ready)" if ready else ""
-            
-            player_text = self.font_tiny.render(f"{prefix}{name}{suffix}", True, color)
-            self.screen.blit(player_text, (60, y))
-            y += 25
+        queue((self._player_lines(), (60, 315 + dy)))
         
         # Chat area
-        pygame.draw.rect(self.screen, (30, 30, 50), (370, 320, 380, 200))
-        pygame.draw.rect(self.screen, (150, 100, 100), (370, 320, 380, 200), 2)
+        queue((panel_chat, (370, 280 + dy)))
         
-        chat_title = self.font_small.render("Chat:", True, (255, 255, 255))
-        self.screen.blit(chat_title, (380, 325))
+        chat_title = self._text(self.font_small, "Chat:", (255, 255, 255))
+        queue((chat_title, (380, 285 + dy)))
         
         # Chat messages
-        y = 350
-        for sender, msg, timestamp in self.chat_messages[-6:]:
-            chat_text = self.font_tiny.render(f"{sender}: {msg}", True, (255, 200, 200))
-            self.screen.blit(chat_text, (380, y))
-            y += 22
+        queue((self._chat_lines(theme.chat_color), (380, 310 + dy)))
         
         # Chat input
-        self._render_input_field("", self.chat_input, 370, 490, 380, "chat")
+        self._render_input_field("", self.chat_input, 370, 450 + dy, 380, "chat")
         
         # Ready/Start buttons
-        if self._button("READY", 50, 540, 120, 50, (0, 100, 0), (0, 150, 0)):
-            self.mouse_was_pressed = current_mouse_pressed
-            return {"type": "ready"}
+        self._button("READY", 50, 500 + dy, 120, 50, (0, 100, 0), (0, 150, 0), action={"type": "ready"})
         
-        if self._button("START PvP", 190, 540, 160, 50, (200, 0, 0), (255, 50, 50)):
-            self.mouse_was_pressed = current_mouse_pressed
-            return {"type": "start_multiplayer_game"}
+        self._button(theme.start_label, 190, 500 + dy, 160, 50, *theme.start_colors, action={"type": "start_multiplayer_game"})
         
-        if self._button("BACK", 600, 540, 150, 50, (150, 0, 0), (200, 0, 0)):
-            self.mouse_was_pressed = current_mouse_pressed
-            return {"type": "change_state", "state": "MULTIPLAYER_MENU"}
-        
-        # Update mouse state at end of frame
-        self.mouse_was_pressed = current_mouse_pressed
-        return None
+        self._button("BACK", 600, 500 + dy, 150, 50, (150, 0, 0), (200, 0, 0), action={"type": "change_state", "state": theme.back_state})
     
     def _render_input_field(self, label: str, text: str, x: int, y: int, width: int, field_id: str):
         """Render a text input field"""
+        queue = self._frame_blits.append
         if label:
-            label_surf = self.font_tiny.render(label, True, (200, 200, 200))
-            self.screen.blit(label_surf, (x, y))
+            label_surf = self._text(self.font_tiny, label, (200, 200, 200))
+            queue((label_surf, (x, y)))
             y += 20
         
         # Background
         is_active = self.active_input_field == field_id
-        bg_color = (50, 50, 70) if is_active else (30, 30, 40)
-        border_color = (100, 150, 255) if is_active else (80, 80, 100)
+        bg = self._field_bg_cache.get((width, is_active))
+        if bg is None:
+            if is_active:
+                bg = self._make_panel(width, 30, (100, 150, 255), fill=(50, 50, 70))
+            else:
+                bg = self._make_panel(width, 30, (80, 80, 100), fill=(30, 30, 40))
+            self._field_bg_cache[(width, is_active)] = bg
         
         rect = pygame.Rect(x, y, width, 30)
-        pygame.draw.rect(self.screen, bg_color, rect)
-        pygame.draw.rect(self.screen, border_color, rect, 2)
-        
-        # Text
-        text_surf = self.font_tiny.render(text, True, (255, 255, 255))
-        self.screen.blit(text_surf, (x + 5, y + 5))
+        queue((bg, rect))
+        
+        # Text, laid out glyph by glyph from the atlas
+        glyph = self._glyph
+        font = self.font_tiny
+        pen_x = x + 5
+        text_y = y + 5
+        for ch in text:
+            surf, advance = glyph(font, ch, (255, 255, 255))
+            queue((surf, (pen_x, text_y)))
+            pen_x += advance
         
         # Cursor
-        if is_active and int(time.time() * 2) % 2 == 0:
-            cursor_x = x + 5 + self.font_tiny.size(text)[0]
-            pygame.draw.line(self.screen, (255, 255, 255), (cursor_x, y + 5), (cursor_x, y + 25), 2)
+        if is_active and self._blink_on:
+            queue((self._cursor_surf, (pen_x, y + 5)))
         
-        # Click detection
-        mouse = pygame.mouse.get_pos()
-        click = pygame.mouse.get_pressed()[0]
-        if rect.collidepoint(mouse) and click:
-            self.active_input_field = field_id
+        # Clicking the field focuses it
+        self._click_targets.append((rect, partial(self._focus_field, field_id)))
     
     def render_level_select(self, game_state):
         """Render level selection screen"""
-        # Reset frame click tracking and update mouse state at start of render
-        self.frame_click_processed = False
-        current_mouse_pressed = pygame.mouse.get_pressed()[0]
-        if not current_mouse_pressed:
-            self.mouse_was_pressed = False
-        
-        title = self.font_big.render("SELECT LEVEL", True, (255, 215, 0))
-        self.screen.blit(title, (200, 40))
+        queue = self._frame_blits.append
+        title = self._text(self.font_big, "SELECT LEVEL", (255, 215, 0))
+        queue((title, (200, 40)))
         
         # Scroll hints
         if self.level_scroll > 0:
-            scroll_hint = self.font_small.render("^ Scroll Up", True, (150, 150, 150))
-            self.screen.blit(scroll_hint, (320, 90))
+            scroll_hint = self._text(self.font_small, "^ Scroll Up", (150, 150, 150))
+            queue((scroll_hint, (320, 90)))
         
-        max_scroll = max(0, ((game_state.max_level - 1) // 5) * 100 - 300)
-        if self.level_scroll < max_scroll:
-            scroll_hint = self.font_small.render("v Scroll Down", True, (150, 150, 150))
-            self.screen.blit(scroll_hint, (310, 500))
+        max_level = game_state.max_level
+        labels = self._lvl_label_surfs
+        for lvl in range(len(labels) + 1, max_level + 1):
+            labels.append(self.font_small.render(str(lvl), True, (255, 255, 255)))
         
-        for i in range(game_state.max_level):
+        max_scroll = max(0, ((max_level - 1) // 5) * 100 - 300)
+        if self.level_scroll < max_scroll:
+            scroll_hint = self._text(self.font_small, "v Scroll Down", (150, 150, 150))
+            queue((scroll_hint, (310, 500)))
+        
+        # Only visit rows whose top edge lands in -80..600 (row r sits at 140 + r*100 - scroll)
+        scroll = self.level_scroll
+        first_row = max(0, -((220 - scroll) // 100))
+        last_row = (scroll + 460) // 100
+        for i in range(first_row * 5, min(max_level, (last_row + 1) * 5)):
             r, c = divmod(i, 5)
             lvl = i + 1
-            y_pos = 140 + r * 100 - self.level_scroll
+            y_pos = 140 + r * 100 - scroll
+            
+            btn_color = (200, 0, 200) if lvl % 10 == 0 else (0, 100, 200)
+            btn_hover = (255, 0, 255) if lvl % 10 == 0 else (0, 150, 255)
             
-            if -80 <= y_pos <= 600:
-                btn_color = (200, 0, 200) if lvl % 10 == 0 else (0, 100, 200)
-                btn_hover = (255, 0, 255) if lvl % 10 == 0 else (0, 150, 255)
-                
-                if self._button(str(lvl), 120 + c*120, y_pos, 100, 80, btn_color, btn_hover):
-                    self.mouse_was_pressed = current_mouse_pressed
-                    return {"type": "start_level", "level": lvl}
+            self._button(str(lvl), 120 + c*120, y_pos, 100, 80, btn_color, btn_hover, label_surf=labels[i], action={"type": "start_level", "level": lvl})
         
         # Scroll buttons
-        max_scroll = max(0, ((game_state.max_level - 1) // 5) * 100 - 300)
-        
         if max_scroll > 0:
-            if self._button("â–² TOP", 50, 100, 60, 40, (60, 60, 80), (100, 100, 120)):
-                self.level_scroll = 0
-                self.mouse_was_pressed = current_mouse_pressed
-            
-            if self._button("â–¼ END", 50, 490, 60, 40, (60, 60, 80), (100, 100, 120)):
-                self.level_scroll = max_scroll
-                self.mouse_was_pressed = current_mouse_pressed
+            self._button("â–² TOP", 50, 100, 60, 40, (60, 60, 80), (100, 100, 120),
+                         action=partial(self._set_level_scroll, 0))
+            self._button("â–¼ END", 50, 490, 60, 40, (60, 60, 80), (100, 100, 120),
+                         action=partial(self._set_level_scroll, max_scroll))
         
-        if self._button("BACK", 300, 540, 200, 60, (150, 0, 0), (200, 0, 0)):
-            self.mouse_was_pressed = current_mouse_pressed
-            return {"type": "change_state", "state": "MENU"}
-        
-        # Update mouse state at end of frame
-        self.mouse_was_pressed = current_mouse_pressed
-        return None
+        self._button("BACK", 300, 540, 200, 60, (150, 0, 0), (200, 0, 0), action={"type": "change_state", "state": Screen.MENU})
     
     def render_shop_menu(self):
         """Render shop selection menu"""
-        title = self.font_big.render("SHOP", True, (255, 215, 0))
-        self.screen.blit(title, (330, 100))
-        
-        if self._button("Normal Shop", 250, 240, 300, 70, (0, 120, 200), (0, 170, 255)):
-            return {"type": "change_state", "state": "SHOP"}
+        self._cached_scene("shop_menu", (), self._draw_shop_menu)
+    
+    def _draw_shop_menu(self):
+        """Queue the shop selection menu"""
+        queue = self._frame_blits.append
+        title = self._text(self.font_big, "SHOP", (255, 215, 0))
+        queue((title, (330, 100)))
         
-        if self._button("Ability Temple", 250, 340, 300, 70, (160, 80, 200), (220, 120, 255)):
-            return {"type": "enter_temple"}
+        self._button("Normal Shop", 250, 240, 300, 70, (0, 120, 200), (0, 170, 255), action={"type": "change_state", "state": Screen.SHOP})
         
-        if self._button("BACK", 300, 450, 200, 60, (150, 0, 0), (200, 0, 0)):
-            return {"type": "change_state", "state": "MENU"}
+        self._button("Ability Temple", 250, 340, 300, 70, (160, 80, 200), (220, 120, 255), action={"type": "enter_temple"})
         
-        return None
+        self._button("BACK", 300, 450, 200, 60, (150, 0, 0), (200, 0, 0), action={"type": "change_state", "state": Screen.MENU})
     
     def render_shop(self, game_state):
         """Render upgrade shop"""
-        title = self.font_big.render("SHOP", True, (255, 215, 0))
-        self.screen.blit(title, (330, 30))
-        
-        coins = self.font_med.render(f"Coins: {game_state.coins}", True, (255, 215, 0))
-        self.screen.blit(coins, (300, 90))
-        
-        max_lv = self.font_tiny.render(f"Max Level: {game_state.max_level}", True, (150, 200, 150))
-        self.screen.blit(max_lv, (340, 125))
-        
-        items = [
-            ("Damage+", "damage", 50, 30, "Increase bullet damage", 1),
-            ("Fire Rate+", "firerate", 80, 30, "Shoot faster", 1),
-            ("Max HP+", "health", 100, 20, "Increase max health", 1),
-            ("Speed+", "speed", 60, 15, "Bullets move faster", 1),
-            ("Triple Shot", "triple", 250, 1, "Fire 3 bullets at once", 1),
-            ("Rapid Fire", "rapid", 350, 1, "Halve fire rate cooldown", 3),
-            ("Shield", "shield", 300, 1, "Block one attack", 1),
-            ("Piercing", "piercing", 400, 1, "Bullets pass through", 5),
-            ("Lifesteal", "lifesteal", 500, 1, "Heal 0.5 health per hit", 5),
-            ("Multishot+", "multishot", 150, 5, "Fire even more shots", 3),
-            ("Critical Hit", "crit", 450, 1, "25% chance 2x damage", 7),
-            ("Regeneration", "regen", 600, 1, "Heal 2 HP every 2s", 7),
-            ("Ultra Damage", "ultradamage", 800, 10, "MASSIVE damage boost", 10),
-            ("Mega Shield", "megashield", 1200, 1, "Block THREE attacks", 10),
-            ("Time Slow", "timeslow", 1500, 1, "50% slower enemies", 12),
-            ("Explosive", "explosive", 2000, 1, "Bullets explode on hit", 15),
-            ("Vampire", "vampire", 2500, 1, "Heal 1 per hit", 15),
-            ("Berserker", "berserker", 3000, 1, "2x damage under 30% HP", 20),
-            ("Golden Heart", "goldenheart", 1000, 10, "+50 max HP per level", 20),
-            ("Laser Null", "lasernull", 4000, 1, "50% laser dodge chance", 25),
-            ("God Mode", "godmode", 10000, 1, "Start with 500 HP", 30),
-            ("Reflect", "reflect", 5000, 1, "Reflect 3 attacks/level", 30),
-            ("Immortal", "immortal", 25000, 1, "Survive lethal damage once", 40),
-            ("Berserker Squared", "berserker_sqr", 10000, 1, "Damage ^1.5 at <10% HP", 40),
-            ("Nuclear Shot", "nuclearshot", 30000, 1, "Massive explosions", 45),
-            ("Infinite Ammo", "infiniteammo", 20000, 1, "No fire rate cooldown", 50),
-            ("Titan Shield", "titanshield", 35000, 1, "Block FIVE attacks", 50),
-            ("Voidwalker", "voidwalker", 50000, 1, "5s invincibility every 30s", 60),
-            ("Parry", "parry", 2000, 1, "Reflect attacks with Spacebar", 15),
-            ("Bullet Storm", "bulletstorm", 1500, 1, "Rapid-fire bullet output", 12),
-            ("Homing Rounds", "homingrounds", 3500, 1, "Bullets auto-home to boss", 18),
-        ]
+        queue = self._frame_blits.append
+        title = self._text(self.font_big, "SHOP", (255, 215, 0))
+        queue((title, (330, 30)))
+        
+        coins = self._text(self.font_med, f"Coins: {game_state.coins}", (255, 215, 0))
+        queue((coins, (300, 90)))
+        
+        max_lv = self._text(self.font_tiny, f"Max Level: {game_state.max_level}", (150, 200, 150))
+        queue((max_lv, (340, 125)))
+        
         
         # Scroll hint
         if self.shop_scroll < 1500:
-            scroll_hint = self.font_tiny.render("v Scroll for more", True, (150, 150, 150))
-            self.screen.blit(scroll_hint, (320, 560))
-        
-        for idx, (name, key, base, max_lv, desc, req_level) in enumerate(items):
-            y = 160 + idx * 75 - self.shop_scroll
-            if y < -75 or y > 600:
-                continue
+            scroll_hint = self._text(self.font_tiny, "v Scroll for more", (150, 150, 150))
+            queue((scroll_hint, (320, 560)))
+        
+        # Only visit items whose row top lands in -75..600 (row idx sits at 160 + idx*75 - scroll)
+        scroll = self.shop_scroll
+        first = max(0, -((235 - scroll) // 75))
+        last = min(len(SHOP_ITEMS), (scroll + 440) // 75 + 1)
+        for idx in range(first, last):
+            name, key, base, max_lv, desc, req_level = SHOP_ITEMS[idx]
+            y = 160 + idx * 75 - scroll
             
             cur = self.save_data["upgrades"][key]
             locked = game_state.max_level < req_level
@@ -595,19 +771,25 @@ class UIManager:
                 lv_text = "MAX" if owned else f"Lv {cur}/{max_lv}"
                 cost = base * (cur + 1)
             
-            name_color = (100, 100, 100) if locked else (200, 255, 200)
-            name_surf = self.font_tiny.render(name, True, name_color)
-            self.screen.blit(name_surf, (40, y))
+            static = self._shop_static_cache.get(key)
+            if static is None:
+                static = self._shop_static_cache[key] = (
+                    self.font_tiny.render(name, True, (200, 255, 200)),
+                    self.font_tiny.render(name, True, (100, 100, 100)),
+                    self.font_tiny.render(f"Requires Lv {req_level}", True, (255, 100, 100)),
+                    self.font_tiny.render(desc, True, (120, 120, 150)),
+                )
+            name_surf, locked_name_surf, lock_surf, desc_surf = static
+            
+            queue((locked_name_surf if locked else name_surf, (40, y)))
             
             if locked:
-                lock_surf = self.font_tiny.render(f"Requires Lv {req_level}", True, (255, 100, 100))
-                self.screen.blit(lock_surf, (40, y+22))
+                queue((lock_surf, (40, y+22)))
             else:
-                lv_surf = self.font_tiny.render(lv_text, True, (180, 180, 180))
-                self.screen.blit(lv_surf, (40, y+22))
+                lv_surf = self._text(self.font_tiny, lv_text, (180, 180, 180))
+                queue((lv_surf, (40, y+22)))
             
-            desc_surf = self.font_tiny.render(desc, True, (120, 120, 150))
-            self.screen.blit(desc_surf, (40, y+44))
+            queue((desc_surf, (40, y+44)))
             
             can_buy = (not owned) and (game_state.coins >= cost) and (not locked)
             
@@ -618,223 +800,213 @@ class UIManager:
             else:
                 col = (80, 40, 40)
             
-            if self._button("LOCKED" if locked else f"${cost}", 550, y, 120, 50, col, (col[0]+40, col[1]+40, col[2]+40)):
-                if can_buy:
-                    return {"type": "buy_upgrade", "key": key, "cost": cost, "current": cur}
-        
-        if self._button("BACK", 300, 560, 200, 50, (150, 0, 0), (200, 0, 0)):
-            return {"type": "change_state", "state": "SHOP_MENU"}
+            buy = {"type": "buy_upgrade", "key": key, "cost": cost, "current": cur} if can_buy else None
+            self._button("LOCKED" if locked else f"${cost}", 550, y, 120, 50, col, (col[0]+40, col[1]+40, col[2]+40), action=buy)
         
-        return None
+        self._button("BACK", 300, 560, 200, 50, (150, 0, 0), (200, 0, 0), action={"type": "change_state", "state": Screen.SHOP_MENU})
     
     def render_ability_temple(self, game_state, ability_manager):
         """Render ability temple with animations"""
-        title = self.font_big.render("ABILITY TEMPLE", True, (200, 150, 255))
-        self.screen.blit(title, (180, 40))
+        # Text goes through the frame queue; the podium/glow/particle
+        # primitives below draw immediately underneath it
+        queue = self._frame_blits.append
+        title = self._text(self.font_big, "ABILITY TEMPLE", (200, 150, 255))
+        queue((title, (180, 40)))
         
         allowed = (game_state.max_level // 10) - self.save_data.get("ability_picks_used", 0)
         
         picks_text = f"Ability Picks Remaining: {allowed}"
         picks_color = (200, 255, 200) if allowed > 0 else (255, 100, 100)
-        picks_surf = self.font_small.render(picks_text, True, picks_color)
-        self.screen.blit(picks_surf, (260, 100))
+        picks_surf = self._text(self.font_small, picks_text, picks_color)
+        queue((picks_surf, (260, 100)))
         
         podium_x = [150, 400, 650]
+        # One clock read per frame keeps the podium, float and glow phases coherent
+        now = time.time()
+        blit = self.screen.blit
+        # random.random is a single C call; randint goes through several
+        # Python-level frames, so particle offsets are scaled from it instead
+        rand = random.random
+        podium_surf = self._podium_surf
+        rarity_colors = ability_manager.RARITY_COLORS
+        # SELECT button (normal, hover) colors: green while picks remain, grey otherwise
+        select_color, select_hover = ((0, 150, 0), (50, 200, 50)) if allowed > 0 else ((80, 80, 80), (130, 130, 130))
         
         for i, ability in enumerate(ability_manager.temple_choices):
             stacks = ability_manager.get_ability_stacks(ability.name)
-            rarity_color = ability_manager.RARITY_COLORS.get(ability.rarity, (255, 255, 255))
+            rarity_color = rarity_colors.get(ability.rarity, (255, 255, 255))
             
             base_y = 360
-            podium_y = base_y + math.sin(time.time() * 2 + i * 1.7) * 8
+            podium_y = base_y + _sinlut(now * 2 + i * 1.7, 8)
             
             # Enhanced podium
-            pygame.draw.rect(self.screen, (100, 100, 150), (podium_x[i]-50, int(podium_y), 100, 20))
-            pygame.draw.rect(self.screen, (150, 150, 200), (podium_x[i]-45, int(podium_y)-10, 90, 10))
-            pygame.draw.rect(self.screen, (80, 80, 100), (podium_x[i]-50, int(podium_y)+20, 100, 20))
+            blit(podium_surf, (podium_x[i]-50, podium_y-10))
             
-            float_y = 280 + math.sin(time.time() * 1.5 + i * 1.7) * 12
+            float_y = 280 + _sinlut(now * 1.5 + i * 1.7, 12)
             
-            # Pulsing glow
-            glow = 100 + math.sin(time.time() * 4 + i) * 50
-            pygame.draw.rect(self.screen, (*rarity_color, int(glow)), 
-                           (podium_x[i]-65, int(float_y)-10, 130, 90), 3)
+            # Pulsing glow (alpha 50-150)
+            glow = 100 + _sinlut(now * 4 + i, 50)
+            glow_surf = self._glow(rarity_color)
+            glow_surf.set_alpha(glow)
+            blit(glow_surf, (podium_x[i]-65, float_y-10))
             
             # Ability particles
-            if random.random() < 0.3:
-                particle_x = podium_x[i] + random.randint(-40, 40)
-                particle_y = float_y + random.randint(-20, 40)
-                pygame.draw.circle(self.screen, rarity_color, (particle_x, int(particle_y)), 2)
+            if rand() < 0.3:
+                particle_x = podium_x[i] + int(rand() * 81) - 40
+                particle_y = float_y + int(rand() * 61) - 20
+                blit(self._dot(rarity_color), (particle_x - 2, particle_y - 2))
             
-            name_surf = self.font_small.render(ability.name, True, rarity_color)
-            self.screen.blit(name_surf, (podium_x[i]-80, int(float_y)))
+            name_surf = self._text(self.font_small, ability.name, rarity_color)
+            queue((name_surf, (podium_x[i]-80, float_y)))
             
-            stack_surf = self.font_tiny.render(f"Stacks: {stacks}", True, (200, 200, 200))
-            self.screen.blit(stack_surf, (podium_x[i]-40, int(float_y)+28))
+            stack_surf = self._stacks_cache.get(stacks)
+            if stack_surf is None:
+                stack_surf = self._stacks_cache[stacks] = self.font_tiny.render(f"Stacks: {stacks}", True, (200, 200, 200))
+            queue((stack_surf, (podium_x[i]-40, float_y+28)))
             
-            desc_surf = self.font_tiny.render(ability.description, True, (160, 160, 200))
-            self.screen.blit(desc_surf, (podium_x[i]-90, int(float_y)+48))
+            desc_surf = self._text(self.font_tiny, ability.description, (160, 160, 200))
+            queue((desc_surf, (podium_x[i]-90, float_y+48)))
             
-            select_color = (0, 150, 0) if allowed > 0 else (80, 80, 80)
-            if self._button("SELECT", podium_x[i]-60, 440, 120, 40, select_color, (select_color[0]+50, select_color[1]+50, select_color[2]+50)):
-                if allowed > 0:
-                    return {"type": "select_ability", "ability": ability}
+            select = {"type": "select_ability", "ability": ability} if allowed > 0 else None
+            self._button("SELECT", podium_x[i]-60, 440, 120, 40, select_color, select_hover, action=select)
         
         # Roll button with cost
         roll_cost = ability_manager.get_roll_cost()
-        roll_text = "FIRST ROLL FREE" if roll_cost == 0 else f"ROLL (${roll_cost})"
+        roll_label = self._roll_label_cache.get(roll_cost)
+        if roll_label is None:
+            roll_text = "FIRST ROLL FREE" if roll_cost == 0 else f"ROLL (${roll_cost})"
+            roll_label = self._roll_label_cache[roll_cost] = self.font_small.render(roll_text, True, (255, 255, 255))
         can_afford = roll_cost == 0 or game_state.coins >= roll_cost
         
         roll_color = (150, 100, 200) if can_afford else (80, 40, 80)
-        if self._button(roll_text, 300, 500, 200, 60, roll_color, (200, 150, 255)):
-            if can_afford:
-                self.rolling = True
-                self.roll_start = time.time()
-                return {"type": "roll_temple"}
-        
-        if self._button("BACK", 20, 520, 160, 50, (150, 0, 0), (200, 0, 0)):
-            ability_manager.rolls_this_session = 0
-            return {"type": "change_state", "state": "MENU"}
+        self._button("", 300, 500, 200, 60, roll_color, (200, 150, 255),
+                     action=self._start_roll if can_afford else None, label_surf=roll_label)
         
-        return None
+        self._button("BACK", 20, 520, 160, 50, (150, 0, 0), (200, 0, 0),
+                     action=partial(self._leave_temple, ability_manager))
     
     def render_settings(self):
         """Render settings menu"""
-        title = self.font_big.render("SETTINGS", True, (255, 215, 0))
-        self.screen.blit(title, (270, 40))
-        
-        theme_label = self.font_med.render("Theme:", True, (255, 255, 255))
-        self.screen.blit(theme_label, (150, 150))
-        
-        theme_text = "Dark Mode" if self.save_data["settings"]["theme"] == "dark" else "Light Mode"
-        if self._button(theme_text, 400, 140, 200, 60, (0, 100, 200), (0, 150, 255)):
-            return {"type": "toggle_theme"}
-        
-        move_label = self.font_med.render("Movement:", True, (255, 255, 255))
-        self.screen.blit(move_label, (150, 250))
-        
-        move_text = "Mouse" if self.save_data["settings"]["movement"] == "mouse" else "Arrow Keys"
-        if self._button(move_text, 400, 240, 200, 60, (0, 100, 200), (0, 150, 255)):
-            return {"type": "toggle_movement"}
-        
-        cb_label = self.font_med.render("Colorblind Mode:", True, (255, 255, 255))
-        self.screen.blit(cb_label, (150, 350))
-        
-        cb_text = "ON" if self.save_data["settings"]["colorblind"] else "OFF"
-        if self._button(cb_text, 400, 340, 200, 60, (0, 100, 200), (0, 150, 255)):
-            return {"type": "toggle_colorblind"}
-        
-        admin_text = "ON" if self.save_data["settings"]["admin"] else "OFF"
-        if self._button(admin_text, 725, 550, 50, 30, (0, 100, 200), (0, 150, 255)):
-            return {"type": "change_state", "state": "ADMIN_MENU"}
-        
-        if self._button("BACK", 300, 480, 200, 60, (150, 0, 0), (200, 0, 0)):
-            return {"type": "change_state", "state": "MENU"}
-        
-        return None
+        settings = self.save_data["settings"]
+        key = (settings["theme"], settings["movement"], settings["colorblind"], settings["admin"])
+        self._cached_scene("settings", key, self._draw_settings)
+    
+    def _draw_settings(self):
+        """Queue the settings menu"""
+        queue = self._frame_blits.append
+        title = self._text(self.font_big, "SETTINGS", (255, 215, 0))
+        queue((title, (270, 40)))
+        
+        settings = self.save_data["settings"]
+        for label, label_y, key, on_value, on_text, off_text, action in SETTINGS_ITEMS:
+            queue((self._text(self.font_med, label, (255, 255, 255)), (150, label_y)))
+            value_text = on_text if settings[key] == on_value else off_text
+            self._button(value_text, 400, label_y - 10, 200, 60, (0, 100, 200), (0, 150, 255), action={"type": action})
+        
+        admin_text = "ON" if settings["admin"] else "OFF"
+        self._button(admin_text, 725, 550, 50, 30, (0, 100, 200), (0, 150, 255), action={"type": "change_state", "state": Screen.ADMIN_MENU})
+        
+        self._button("BACK", 300, 480, 200, 60, (150, 0, 0), (200, 0, 0), action={"type": "change_state", "state": Screen.MENU})
     
     def render_admin_menu(self, admin_state):
         """Render admin password screen"""
-        title = self.font_big.render("ADMIN ACCESS", True, (255, 215, 0))
-        self.screen.blit(title, (230, 80))
-        
-        prompt = self.font_small.render("Enter password:", True, (255, 255, 255))
-        self.screen.blit(prompt, (280, 180))
+        self._cached_scene("admin_menu", len(self.admin_input), self._draw_admin_menu)
+    
+    def _draw_admin_menu(self):
+        """Queue the admin password screen"""
+        queue = self._frame_blits.append
+        title = self._text(self.font_big, "ADMIN ACCESS", (255, 215, 0))
+        queue((title, (230, 80)))
         
-        pygame.draw.rect(self.screen, (40, 40, 40), (250, 230, 300, 50))
-        pygame.draw.rect(self.screen, (255, 255, 255), (250, 230, 300, 50), 3)
+        prompt = self._text(self.font_small, "Enter password:", (255, 255, 255))
+        queue((prompt, (280, 180)))
         
-        masked = "*" * len(self.admin_input)
-        input_surf = self.font_med.render(masked, True, (255, 255, 255))
-        self.screen.blit(input_surf, (260, 240))
+        queue((self._admin_box, (250, 230)))
         
-        if self._button("BACK", 300, 380, 200, 60, (150, 0, 0), (200, 0, 0)):
-            self.admin_input = ""
-            return {"type": "change_state", "state": "SETTINGS"}
+        # Password mask, one surface per length
+        length = len(self.admin_input)
+        masks = self._mask_cache
+        while len(masks) <= length:
+            masks.append(self.font_med.render("*" * len(masks), True, (255, 255, 255)))
+        queue((masks[length], (260, 240)))
         
-        return None
+        self._button("BACK", 300, 380, 200, 60, (150, 0, 0), (200, 0, 0), action=self._leave_admin)
     
     def render_pause_menu(self):
         """Render pause overlay"""
-        overlay = pygame.Surface((800, 600))
-        overlay.set_alpha(128)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
-        
-        paused = self.font_big.render("PAUSED", True, (255, 255, 255))
-        self.screen.blit(paused, (280, 200))
+        queue = self._frame_blits.append
+        queue((self._pause_overlay, (0, 0)))
         
-        hint = self.font_small.render("Press ESC to resume", True, (200, 200, 200))
-        self.screen.blit(hint, (260, 280))
+        paused = self._text(self.font_big, "PAUSED", (255, 255, 255))
+        queue((paused, (280, 200)))
         
-        if self._button("Resume", 250, 350, 140, 60, (0, 120, 0), (0, 180, 0)):
-            return {"type": "resume"}
+        hint = self._text(self.font_small, "Press ESC to resume", (200, 200, 200))
+        queue((hint, (260, 280)))
         
-        if self._button("Menu", 410, 350, 140, 60, (150, 0, 0), (200, 0, 0)):
-            return {"type": "change_state", "state": "MENU"}
+        self._button("Resume", 250, 350, 140, 60, (0, 120, 0), (0, 180, 0), action={"type": "resume"})
         
-        return None
+        self._button("Menu", 410, 350, 140, 60, (150, 0, 0), (200, 0, 0), action={"type": "change_state", "state": Screen.MENU})
     
     def render_victory(self, game_state):
         """Render victory screen"""
-        is_super = game_state.level % 10 == 0
+        queue = self._frame_blits.append
+        is_super = game_state.is_super_level
         title_text = "SUPER BOSS DEFEATED!" if is_super else f"LEVEL {game_state.level} CLEARED!"
         title_color = (255, 0, 255) if is_super else (0, 255, 100)
         
-        title_y = 200 + math.sin(time.time() * 3) * 8
-        title = self.font_big.render(title_text, True, title_color)
-        self.screen.blit(title, (80 if is_super else 120, int(title_y)))
+        title_y = 200 + _sinlut(time.time() * 3, 8)
+        title = self._text(self.font_big, title_text, title_color)
+        queue((title, (80 if is_super else 120, title_y)))
         
-        from scaling import ScalingFormulas
         coin_reward = ScalingFormulas.coin_reward(game_state.level)
         
-        coins = self.font_med.render(f"+{coin_reward} coins!", True, (255, 215, 0))
-        self.screen.blit(coins, (290, 280))
-        
-        if self._button("Continue", 200, 400, 180, 60, (0, 150, 0), (0, 200, 0)):
-            return {"type": "change_state", "state": "LEVELSELECT"}
+        coins = self._text(self.font_med, f"+{coin_reward} coins!", (255, 215, 0))
+        queue((coins, (290, 280)))
         
-        if self._button("Shop", 420, 400, 180, 60, (0, 100, 200), (0, 150, 255)):
-            return {"type": "change_state", "state": "SHOP_MENU"}
+        self._button("Continue", 200, 400, 180, 60, (0, 150, 0), (0, 200, 0), action={"type": "change_state", "state": Screen.LEVELSELECT})
         
-        return None
+        self._button("Shop", 420, 400, 180, 60, (0, 100, 200), (0, 150, 255), action={"type": "change_state", "state": Screen.SHOP_MENU})
     
     def render_gameover(self, game_state):
         """Render game over screen"""
-        title = self.font_big.render("GAME OVER", True, (255, 0, 0))
-        self.screen.blit(title, (260, 200))
-        
-        level_text = self.font_small.render(f"Reached Level {game_state.level}", True, (200, 200, 200))
-        self.screen.blit(level_text, (300, 260))
+        self._cached_scene("gameover", game_state.level, partial(self._draw_gameover, game_state))
+    
+    def _draw_gameover(self, game_state):
+        """Queue the game over screen"""
+        queue = self._frame_blits.append
+        title = self._text(self.font_big, "GAME OVER", (255, 0, 0))
+        queue((title, (260, 200)))
         
-        if self._button("Retry", 200, 350, 180, 60, (150, 100, 0), (200, 150, 0)):
-            return {"type": "start_level", "level": game_state.level}
+        level_text = self._text(self.font_small, f"Reached Level {game_state.level}", (200, 200, 200))
+        queue((level_text, (300, 260)))
         
-        if self._button("Menu", 420, 350, 180, 60, (150, 0, 0), (200, 0, 0)):
-            return {"type": "change_state", "state": "MENU"}
+        self._button("Retry", 200, 350, 180, 60, (150, 100, 0), (200, 150, 0), action={"type": "start_level", "level": game_state.level})
         
-        return None
+        self._button("Menu", 420, 350, 180, 60, (150, 0, 0), (200, 0, 0), action={"type": "change_state", "state": Screen.MENU})
     
-    def _button(self, text, x, y, w, h, col, hover_col):
-        """Render button and return True if clicked (only once per click)"""
-        mouse = pygame.mouse.get_pos()
-        mouse_pressed = pygame.mouse.get_pressed()[0]
-        rect = pygame.Rect(x, y, w, h)
+    def _button(self, text, x, y, w, h, col, hover_col, action=None, label_surf=None):
+        """Queue a button and register its click action for handle_event"""
+        mouse = self._mouse_pos
+        rect_key = (x, y, w, h)
+        rect = self._rect_cache.get(rect_key)
+        if rect is None:
+            # Scrolling screens produce many positions; start over rather than grow forever
+            if len(self._rect_cache) >= RECT_CACHE_SIZE:
+                self._rect_cache.clear()
+            rect = self._rect_cache[rect_key] = pygame.Rect(x, y, w, h)
         
         color = hover_col if rect.collidepoint(mouse) else col
-        pygame.draw.rect(self.screen, color, rect)
-        pygame.draw.rect(self.screen, (255, 255, 255), rect, 3)
-        
-        text_surf = self.font_small.render(text, True, (255, 255, 255))
+        bg_key = (w, h, color)
+        bg = self._button_surf_cache.get(bg_key)
+        if bg is None:
+            bg = self._button_surf_cache[bg_key] = pygame.Surface((w, h))
+            bg.fill(color)
+            pygame.draw.rect(bg, (255, 255, 255), bg.get_rect(), 3)
+        
+        text_surf = label_surf if label_surf is not None else self._text(self.font_small, text, (255, 255, 255))
         text_rect = text_surf.get_rect(center=rect.center)
-        self.screen.blit(text_surf, text_rect)
-        
-        # Detect click: mouse pressed now but wasn't pressed last frame
-        # Only process one click per frame to prevent multiple buttons triggering
-        clicked = False
-        if rect.collidepoint(mouse) and mouse_pressed and not self.mouse_was_pressed and not self.frame_click_processed:
-            clicked = True
-            self.frame_click_processed = True  # Mark that we've processed a click this frame
+        self._frame_blits.append((bg, rect))
+        self._frame_blits.append((text_surf, text_rect))
         
-        # Note: mouse_was_pressed is updated at the end of render functions, not here
-        return clicked
+        if action is not None:
+            self._click_targets.append((rect, action))